@@ -4,10 +4,12 @@ Legal Database Management Module
 Provides database managers for legal data with attorney-client privilege protection
 """
 
-from .sqlite_legal_manager import LegalDataManager
-from .chromadb_legal_manager import LegalKnowledgeStore
+from .sqlite_legal_manager import LegalDataManager, get_legal_data_manager
+from .chromadb_legal_manager import LegalKnowledgeStore, get_legal_knowledge_store
 
 __all__ = [
     'LegalDataManager',
-    'LegalKnowledgeStore'
+    'LegalKnowledgeStore',
+    'get_legal_data_manager',
+    'get_legal_knowledge_store'
 ]
\ No newline at end of file
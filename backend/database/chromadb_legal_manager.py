@@ -5,17 +5,31 @@ Handles legal document embeddings, RAG search, and legal knowledge retrieval
 """
 
 import chromadb
+from chromadb import Documents, EmbeddingFunction, Embeddings
 from chromadb.config import Settings
-import json
+import orjson
 import logging
 import os
 from typing import List, Dict, Any, Optional
 from datetime import datetime
+from functools import lru_cache
 import hashlib
 from sentence_transformers import SentenceTransformer
 
 logger = logging.getLogger(__name__)
 
+# Documents per embedding model forward pass when adding in bulk
+EMBEDDING_BATCH_SIZE = 64
+
+class LegalEmbeddingFunction(EmbeddingFunction):
+    """Chroma embedding function that encodes each list of texts in batched model passes"""
+    
+    def __init__(self, model: SentenceTransformer):
+        self.model = model
+    
+    def __call__(self, input: Documents) -> Embeddings:
+        return self.model.encode(list(input), batch_size=EMBEDDING_BATCH_SIZE, convert_to_numpy=True).tolist()
+
 class LegalKnowledgeStore:
     """
     Manages legal document embeddings and knowledge retrieval using ChromaDB
@@ -38,8 +52,13 @@ class LegalKnowledgeStore:
                 )
             )
             
-            # Initialize legal embedding model
+            # Initialize legal embedding model; half precision doubles GPU throughput
             self.embedding_model = SentenceTransformer('all-MiniLM-L6-v2')
+            if self.embedding_model.device.type == 'cuda':
+                self.embedding_model.half()
+            
+            # Collections embed query texts with the same model used for stored documents
+            self.embedding_function = LegalEmbeddingFunction(self.embedding_model)
             
             # Create legal document collections
             self._initialize_legal_collections()
@@ -56,6 +75,7 @@ class LegalKnowledgeStore:
             # Case Law Collection
             self.case_law_collection = self.client.get_or_create_collection(
                 name="legal_case_law",
+                embedding_function=self.embedding_function,
                 metadata={
                     "description": "Legal case law with holdings, facts, and legal reasoning",
                     "type": "case_law",
@@ -66,6 +86,7 @@ class LegalKnowledgeStore:
             # Statutes Collection
             self.statutes_collection = self.client.get_or_create_collection(
                 name="legal_statutes",
+                embedding_function=self.embedding_function,
                 metadata={
                     "description": "Federal and state statutes with legal text and interpretations",
                     "type": "statutes",
@@ -76,6 +97,7 @@ class LegalKnowledgeStore:
             # Legal Precedents Collection
             self.precedents_collection = self.client.get_or_create_collection(
                 name="legal_precedents",
+                embedding_function=self.embedding_function,
                 metadata={
                     "description": "Legal precedents with principles and fact patterns",
                     "type": "precedents",
@@ -86,6 +108,7 @@ class LegalKnowledgeStore:
             # Contract Templates Collection
             self.contracts_collection = self.client.get_or_create_collection(
                 name="legal_contracts",
+                embedding_function=self.embedding_function,
                 metadata={
                     "description": "Contract templates and clauses with legal analysis",
                     "type": "contracts",
@@ -96,6 +119,7 @@ class LegalKnowledgeStore:
             # Legal Documents Collection (for client-specific documents)
             self.documents_collection = self.client.get_or_create_collection(
                 name="legal_documents",
+                embedding_function=self.embedding_function,
                 metadata={
                     "description": "Client legal documents with privilege protection",
                     "type": "client_documents",
@@ -107,6 +131,7 @@ class LegalKnowledgeStore:
             # Legal Regulations Collection
             self.regulations_collection = self.client.get_or_create_collection(
                 name="legal_regulations",
+                embedding_function=self.embedding_function,
                 metadata={
                     "description": "Federal and state regulations with compliance guidance",
                     "type": "regulations",
@@ -123,7 +148,7 @@ class LegalKnowledgeStore:
     def add_case_law(self, case_data: Dict[str, Any]) -> bool:
         """Add case law to the knowledge base"""
         try:
-            case_id = case_data.get('case_id', self._generate_case_id(case_data))
+            case_id = self._case_id(case_data)
             
             # Create searchable text combining key legal elements
             searchable_text = self._create_case_searchable_text(case_data)
@@ -132,20 +157,7 @@ class LegalKnowledgeStore:
             embedding = self.embedding_model.encode(searchable_text).tolist()
             
             # Prepare metadata
-            metadata = {
-                'case_name': case_data.get('case_name', ''),
-                'citation': case_data.get('citation', ''),
-                'court': case_data.get('court', ''),
-                'jurisdiction': case_data.get('jurisdiction', ''),
-                'decision_date': case_data.get('decision_date', ''),
-                'precedent_type': case_data.get('precedent_type', 'binding'),
-                'practice_areas': json.dumps(case_data.get('practice_areas', [])),
-                'legal_issues': json.dumps(case_data.get('legal_issues', [])),
-                'citation_count': case_data.get('citation_count', 0),
-                'overruled': case_data.get('overruled', False),
-                'document_type': 'case_law',
-                'added_date': datetime.now().isoformat()
-            }
+            metadata = self._case_law_metadata(case_data)
             
             # Add to collection
             self.case_law_collection.add(
@@ -155,13 +167,39 @@ class LegalKnowledgeStore:
                 metadatas=[metadata]
             )
             
-            logger.info(f"Case law {case_id} added successfully")
+            logger.debug("Case law %s added successfully", case_id)
             return True
             
         except Exception as e:
             logger.error(f"Failed to add case law: {str(e)}")
             return False
     
+    def add_case_law_batch(self, cases: List[Dict[str, Any]]) -> int:
+        """Add case law in bulk, embedding them as one encoder batch and a single collection add"""
+        return self._add_batch(
+            self.case_law_collection, 'case law',
+            ids=[self._case_id(case) for case in cases],
+            documents=[self._create_case_searchable_text(case) for case in cases],
+            metadatas=[self._case_law_metadata(case) for case in cases]
+        )
+    
+    def _case_law_metadata(self, case_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Build collection metadata for case law"""
+        return {
+            'case_name': case_data.get('case_name', ''),
+            'citation': case_data.get('citation', ''),
+            'court': case_data.get('court', ''),
+            'jurisdiction': case_data.get('jurisdiction', ''),
+            'decision_date': case_data.get('decision_date', ''),
+            'precedent_type': case_data.get('precedent_type', 'binding'),
+            'practice_areas': orjson.dumps(case_data.get('practice_areas', [])).decode(),
+            'legal_issues': orjson.dumps(case_data.get('legal_issues', [])).decode(),
+            'citation_count': case_data.get('citation_count', 0),
+            'overruled': case_data.get('overruled', False),
+            'document_type': 'case_law',
+            'added_date': datetime.now().isoformat()
+        }
+    
     def _create_case_searchable_text(self, case_data: Dict[str, Any]) -> str:
         """Create searchable text for case law"""
         elements = []
@@ -211,18 +249,7 @@ class LegalKnowledgeStore:
             embedding = self.embedding_model.encode(searchable_text).tolist()
             
             # Prepare metadata
-            metadata = {
-                'title': statute_data.get('title', ''),
-                'citation': statute_data.get('citation', ''),
-                'jurisdiction': statute_data.get('jurisdiction', ''),
-                'chapter': statute_data.get('chapter', ''),
-                'section': statute_data.get('section', ''),
-                'effective_date': statute_data.get('effective_date', ''),
-                'keywords': json.dumps(statute_data.get('keywords', [])),
-                'practice_areas': json.dumps(statute_data.get('practice_areas', [])),
-                'document_type': 'statute',
-                'added_date': datetime.now().isoformat()
-            }
+            metadata = self._statute_metadata(statute_data)
             
             # Add to collection
             self.statutes_collection.add(
@@ -232,13 +259,37 @@ class LegalKnowledgeStore:
                 metadatas=[metadata]
             )
             
-            logger.info(f"Statute {statute_id} added successfully")
+            logger.debug("Statute %s added successfully", statute_id)
             return True
             
         except Exception as e:
             logger.error(f"Failed to add statute: {str(e)}")
             return False
     
+    def add_statute_batch(self, statutes: List[Dict[str, Any]]) -> int:
+        """Add statutes in bulk, embedding them as one encoder batch and a single collection add"""
+        return self._add_batch(
+            self.statutes_collection, 'statute',
+            ids=[statute.get('statute_id', self._generate_statute_id(statute)) for statute in statutes],
+            documents=[self._create_statute_searchable_text(statute) for statute in statutes],
+            metadatas=[self._statute_metadata(statute) for statute in statutes]
+        )
+    
+    def _statute_metadata(self, statute_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Build collection metadata for a statute"""
+        return {
+            'title': statute_data.get('title', ''),
+            'citation': statute_data.get('citation', ''),
+            'jurisdiction': statute_data.get('jurisdiction', ''),
+            'chapter': statute_data.get('chapter', ''),
+            'section': statute_data.get('section', ''),
+            'effective_date': statute_data.get('effective_date', ''),
+            'keywords': orjson.dumps(statute_data.get('keywords', [])).decode(),
+            'practice_areas': orjson.dumps(statute_data.get('practice_areas', [])).decode(),
+            'document_type': 'statute',
+            'added_date': datetime.now().isoformat()
+        }
+    
     def _create_statute_searchable_text(self, statute_data: Dict[str, Any]) -> str:
         """Create searchable text for statute"""
         elements = []
@@ -280,18 +331,7 @@ class LegalKnowledgeStore:
             embedding = self.embedding_model.encode(searchable_text).tolist()
             
             # Prepare metadata
-            metadata = {
-                'legal_principle': precedent_data.get('legal_principle', ''),
-                'precedent_weight': precedent_data.get('precedent_weight', 5),
-                'binding_authority': precedent_data.get('binding_authority', ''),
-                'jurisdiction': precedent_data.get('jurisdiction', ''),
-                'practice_area': precedent_data.get('practice_area', ''),
-                'fact_pattern': precedent_data.get('fact_pattern', ''),
-                'legal_standard': precedent_data.get('legal_standard', ''),
-                'overruled': precedent_data.get('overruled', False),
-                'document_type': 'precedent',
-                'added_date': datetime.now().isoformat()
-            }
+            metadata = self._precedent_metadata(precedent_data)
             
             # Add to collection
             self.precedents_collection.add(
@@ -301,13 +341,37 @@ class LegalKnowledgeStore:
                 metadatas=[metadata]
             )
             
-            logger.info(f"Precedent {precedent_id} added successfully")
+            logger.debug("Precedent %s added successfully", precedent_id)
             return True
             
         except Exception as e:
             logger.error(f"Failed to add precedent: {str(e)}")
             return False
     
+    def add_precedent_batch(self, precedents: List[Dict[str, Any]]) -> int:
+        """Add precedents in bulk, embedding them as one encoder batch and a single collection add"""
+        return self._add_batch(
+            self.precedents_collection, 'precedent',
+            ids=[precedent.get('precedent_id', self._generate_precedent_id(precedent)) for precedent in precedents],
+            documents=[self._create_precedent_searchable_text(precedent) for precedent in precedents],
+            metadatas=[self._precedent_metadata(precedent) for precedent in precedents]
+        )
+    
+    def _precedent_metadata(self, precedent_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Build collection metadata for a precedent"""
+        return {
+            'legal_principle': precedent_data.get('legal_principle', ''),
+            'precedent_weight': precedent_data.get('precedent_weight', 5),
+            'binding_authority': precedent_data.get('binding_authority', ''),
+            'jurisdiction': precedent_data.get('jurisdiction', ''),
+            'practice_area': precedent_data.get('practice_area', ''),
+            'fact_pattern': precedent_data.get('fact_pattern', ''),
+            'legal_standard': precedent_data.get('legal_standard', ''),
+            'overruled': precedent_data.get('overruled', False),
+            'document_type': 'precedent',
+            'added_date': datetime.now().isoformat()
+        }
+    
     def _create_precedent_searchable_text(self, precedent_data: Dict[str, Any]) -> str:
         """Create searchable text for precedent"""
         elements = []
@@ -346,18 +410,7 @@ class LegalKnowledgeStore:
             embedding = self.embedding_model.encode(searchable_text).tolist()
             
             # Prepare metadata
-            metadata = {
-                'template_name': contract_data.get('template_name', ''),
-                'contract_type': contract_data.get('contract_type', ''),
-                'jurisdiction': contract_data.get('jurisdiction', ''),
-                'practice_area': contract_data.get('practice_area', ''),
-                'risk_level': contract_data.get('risk_level', 'medium'),
-                'complexity_level': contract_data.get('complexity_level', 'medium'),
-                'standard_clauses': json.dumps(contract_data.get('standard_clauses', [])),
-                'optional_clauses': json.dumps(contract_data.get('optional_clauses', [])),
-                'document_type': 'contract_template',
-                'added_date': datetime.now().isoformat()
-            }
+            metadata = self._contract_template_metadata(contract_data)
             
             # Add to collection
             self.contracts_collection.add(
@@ -367,13 +420,37 @@ class LegalKnowledgeStore:
                 metadatas=[metadata]
             )
             
-            logger.info(f"Contract template {template_id} added successfully")
+            logger.debug("Contract template %s added successfully", template_id)
             return True
             
         except Exception as e:
             logger.error(f"Failed to add contract template: {str(e)}")
             return False
     
+    def add_contract_template_batch(self, templates: List[Dict[str, Any]]) -> int:
+        """Add contract templates in bulk, embedding them as one encoder batch and a single collection add"""
+        return self._add_batch(
+            self.contracts_collection, 'contract template',
+            ids=[template.get('template_id', self._generate_template_id(template)) for template in templates],
+            documents=[self._create_contract_searchable_text(template) for template in templates],
+            metadatas=[self._contract_template_metadata(template) for template in templates]
+        )
+    
+    def _contract_template_metadata(self, contract_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Build collection metadata for a contract template"""
+        return {
+            'template_name': contract_data.get('template_name', ''),
+            'contract_type': contract_data.get('contract_type', ''),
+            'jurisdiction': contract_data.get('jurisdiction', ''),
+            'practice_area': contract_data.get('practice_area', ''),
+            'risk_level': contract_data.get('risk_level', 'medium'),
+            'complexity_level': contract_data.get('complexity_level', 'medium'),
+            'standard_clauses': orjson.dumps(contract_data.get('standard_clauses', [])).decode(),
+            'optional_clauses': orjson.dumps(contract_data.get('optional_clauses', [])).decode(),
+            'document_type': 'contract_template',
+            'added_date': datetime.now().isoformat()
+        }
+    
     def _create_contract_searchable_text(self, contract_data: Dict[str, Any]) -> str:
         """Create searchable text for contract template"""
         elements = []
@@ -401,6 +478,29 @@ class LegalKnowledgeStore:
         
         return ' | '.join(elements)
     
+    def _add_batch(self, collection, label: str, ids: List[str], documents: List[str],
+                   metadatas: List[Dict[str, Any]]) -> int:
+        """Embed documents in one encoder call and add them to a collection together"""
+        if not ids:
+            return 0
+        
+        try:
+            embeddings = self.embedding_function(documents)
+            
+            collection.add(
+                ids=ids,
+                documents=documents,
+                embeddings=embeddings,
+                metadatas=metadatas
+            )
+            
+            logger.info(f"Added {len(ids)} {label} documents")
+            return len(ids)
+            
+        except Exception as e:
+            logger.error(f"Failed to add {label} batch: {str(e)}")
+            return 0
+    
     def add_legal_document(self, document_data: Dict[str, Any], privilege_protected: bool = True) -> bool:
         """Add legal document with privilege protection"""
         try:
@@ -504,7 +604,7 @@ class LegalKnowledgeStore:
                     for field in ['practice_areas', 'legal_issues']:
                         if field in metadata and metadata[field]:
                             try:
-                                metadata[field] = json.loads(metadata[field])
+                                metadata[field] = orjson.loads(metadata[field])
                             except:
                                 pass
                     
@@ -550,7 +650,7 @@ class LegalKnowledgeStore:
                     for field in ['keywords', 'practice_areas']:
                         if field in metadata and metadata[field]:
                             try:
-                                metadata[field] = json.loads(metadata[field])
+                                metadata[field] = orjson.loads(metadata[field])
                             except:
                                 pass
                     
@@ -643,7 +743,7 @@ class LegalKnowledgeStore:
                     for field in ['standard_clauses', 'optional_clauses']:
                         if field in metadata and metadata[field]:
                             try:
-                                metadata[field] = json.loads(metadata[field])
+                                metadata[field] = orjson.loads(metadata[field])
                             except:
                                 pass
                     
@@ -792,7 +892,7 @@ class LegalKnowledgeStore:
             # Parse legal issues if they're in JSON format
             if isinstance(case_issues, str):
                 try:
-                    case_issues = json.loads(case_issues)
+                    case_issues = orjson.loads(case_issues)
                 except:
                     case_issues = [case_issues]
             
@@ -844,6 +944,10 @@ class LegalKnowledgeStore:
             logger.error(f"Failed to get collection stats: {str(e)}")
             return {}
     
+    def _case_id(self, case_data: Dict[str, Any]) -> str:
+        """Collection id for case law, matching the SQLite case_law_id when one is given"""
+        return case_data.get('case_id') or case_data.get('case_law_id') or self._generate_case_id(case_data)
+    
     def _generate_case_id(self, case_data: Dict[str, Any]) -> str:
         """Generate unique ID for case law"""
         case_name = case_data.get('case_name', '')
@@ -900,7 +1004,6 @@ class LegalKnowledgeStore:
             
         except Exception as e:
             logger.error(f"Legal knowledge store health check failed: {str(e)}")
-<<<<<<< HEAD
             return False
 
     # Additional methods needed by agents
@@ -965,6 +1068,16 @@ class LegalKnowledgeStore:
         except Exception as e:
             logger.error(f"Failed to search regulations: {str(e)}")
             return []
-=======
-            return False
->>>>>>> 6c3aac01d38711e21958dc83ff6d611bbc727be6
+
+@lru_cache(maxsize=None)
+def _shared_legal_knowledge_store(persist_directory: str) -> LegalKnowledgeStore:
+    """Open one LegalKnowledgeStore per absolute persist directory"""
+    return LegalKnowledgeStore(persist_directory)
+
+def get_legal_knowledge_store(persist_directory: str = "./legal_chroma_db") -> LegalKnowledgeStore:
+    """
+    Return the process-wide LegalKnowledgeStore for persist_directory
+    The ChromaDB client and embedding model take seconds to load, so they are
+    loaded once and shared
+    """
+    return _shared_legal_knowledge_store(os.path.abspath(persist_directory))
@@ -5,16 +5,117 @@ Handles legal data, attorney-client privileged communications, and compliance au
 """
 
 import sqlite3
-import json
+import orjson
 import logging
 import os
-from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from functools import lru_cache
+from datetime import date, datetime, timedelta
+from itertools import repeat
+from typing import List, Dict, Any, Optional, Tuple
 import uuid
 from cryptography.fernet import Fernet
+from utils.ids import uuid4_batch
 
 logger = logging.getLogger(__name__)
 
+# Bind dates as ISO text explicitly; the implicit sqlite3 default adapters are
+# deprecated as of Python 3.12 and produced the same strings
+sqlite3.register_adapter(date, date.isoformat)
+sqlite3.register_adapter(datetime, lambda value: value.isoformat(" "))
+
+# Columns the search and seeding paths rely on. Databases built from the older
+# database/schema.sql excerpt lack several of these (e.g. practice_areas).
+_REQUIRED_TABLE_COLUMNS = {
+    'case_law': ('case_law_id', 'case_name', 'citation', 'legal_issues', 'practice_areas', 'summary'),
+    'statutes': ('statute_id', 'title', 'citation', 'keywords', 'practice_areas'),
+    'legal_precedents': ('precedent_id', 'case_law_id', 'legal_principle', 'practice_area', 'overruled')
+}
+
+# Column order for the bulk insert path (natural key first)
+_CASE_LAW_COLUMNS = (
+    'case_law_id', 'case_name', 'citation', 'court', 'jurisdiction', 'decision_date',
+    'legal_issues', 'holding', 'key_facts', 'legal_reasoning', 'precedent_type',
+    'overruled', 'citation_count', 'relevance_keywords', 'practice_areas', 'summary'
+)
+_STATUTE_COLUMNS = (
+    'statute_id', 'title', 'citation', 'jurisdiction', 'chapter', 'section',
+    'effective_date', 'statute_text', 'summary', 'keywords', 'practice_areas'
+)
+_PRECEDENT_COLUMNS = (
+    'precedent_id', 'case_law_id', 'legal_principle', 'precedent_weight', 'binding_authority',
+    'jurisdiction', 'practice_area', 'fact_pattern', 'legal_standard', 'overruled'
+)
+
+# Columns and JSON-encoded columns per bulk insert table
+_BULK_INSERT_TABLES = {
+    'case_law': (_CASE_LAW_COLUMNS, ('legal_issues', 'relevance_keywords', 'practice_areas')),
+    'statutes': (_STATUTE_COLUMNS, ('keywords', 'practice_areas')),
+    'legal_precedents': (_PRECEDENT_COLUMNS, ())
+}
+
+# Tables summarized by get_database_stats
+_STATS_TABLES = (
+    'attorneys', 'clients', 'attorney_client_relationships', 'legal_cases',
+    'privileged_communications', 'legal_documents', 'case_law', 'statutes',
+    'legal_precedents', 'contract_templates', 'ethics_audit_log', 'ai_interactions'
+)
+
+@lru_cache(maxsize=4096)
+def _json_list_text(values: Tuple[Any, ...]) -> str:
+    """Encode a hashable list once; generated rows repeat a few subsets of small value pools"""
+    return orjson.dumps(values).decode()
+
+def _json_column(value: Any) -> str:
+    """JSON-encode a list column value, reusing the memoized text for lists of plain values"""
+    if isinstance(value, list):
+        try:
+            return _json_list_text(tuple(value))
+        except TypeError:
+            # Unhashable members such as dicts are encoded directly
+            pass
+    return orjson.dumps(value).decode()
+
+# SQLite's default SQLITE_MAX_VARIABLE_NUMBER; multi-row inserts stay under it
+_SQLITE_MAX_VARIABLES = 999
+
+@lru_cache(maxsize=None)
+def _build_insert_sql(table: str, columns: Tuple[str, ...], verb: str = 'INSERT',
+                      row_count: int = 1, suffix: str = '') -> str:
+    """Build a parameterized INSERT with row_count VALUES tuples, cached per shape"""
+    row_sql = f"({', '.join('?' * len(columns))})"
+    return (
+        f"{verb} INTO {table} ({', '.join(columns)}) "
+        f"VALUES {', '.join([row_sql] * row_count)} {suffix}"
+    ).rstrip()
+
+# Insert columns shared by the single-record and bulk create paths; updated_at
+# falls back to its CURRENT_TIMESTAMP default on every insert or replace
+_ATTORNEY_COLUMNS = (
+    'attorney_id', 'bar_number', 'first_name', 'last_name', 'law_firm', 'email', 'phone',
+    'practice_areas', 'jurisdiction', 'bar_admission_date'
+)
+_CLIENT_COLUMNS = (
+    'client_id', 'client_type', 'first_name', 'last_name', 'company_name', 'email', 'phone',
+    'address', 'case_matter_type', 'retainer_status', 'conflict_checked'
+)
+_RELATIONSHIP_COLUMNS = (
+    'relationship_id', 'attorney_id', 'client_id', 'matter_description', 'engagement_date',
+    'relationship_status', 'privilege_status', 'retainer_amount', 'billing_rate'
+)
+_ETHICS_AUDIT_COLUMNS = (
+    'audit_id', 'attorney_id', 'client_id', 'action_type', 'action_description',
+    'compliance_rule', 'compliance_status', 'privilege_impact', 'confidentiality_impact',
+    'conflict_impact', 'audit_details', 'remedial_action', 'responsible_attorney',
+    'review_required', 'ip_address', 'user_agent'
+)
+
+_ATTORNEY_INSERT_SQL = _build_insert_sql('attorneys', _ATTORNEY_COLUMNS, 'INSERT OR REPLACE')
+_CLIENT_INSERT_SQL = _build_insert_sql('clients', _CLIENT_COLUMNS, 'INSERT OR REPLACE')
+_RELATIONSHIP_INSERT_SQL = _build_insert_sql('attorney_client_relationships', _RELATIONSHIP_COLUMNS)
+_ETHICS_AUDIT_INSERT_SQL = _build_insert_sql('ethics_audit_log', _ETHICS_AUDIT_COLUMNS)
+
 class LegalDataManager:
     """
     Manages legal data and privileged communications in SQLite database
@@ -26,6 +127,8 @@ class LegalDataManager:
         self.db_path = db_path
         self.conn = sqlite3.connect(db_path, check_same_thread=False)
         self.conn.row_factory = sqlite3.Row  # Enable dict-like access
+        self._transaction_depth = 0
+        self._stats_cache = None
         
         # Initialize encryption for privileged communications
         self.encryption_key = os.getenv('LEGAL_ENCRYPTION_KEY')
@@ -371,11 +474,188 @@ class LegalDataManager:
             logger.error(f"Failed to create legal database tables: {str(e)}")
             raise
     
+    @staticmethod
+    def find_schema_mismatches(db_path: str) -> Dict[str, List[str]]:
+        """Return missing columns per table for an existing database (read-only check)"""
+        if not os.path.exists(db_path):
+            return {}
+        
+        conn = sqlite3.connect(db_path)
+        try:
+            mismatches = {}
+            for table, required_columns in _REQUIRED_TABLE_COLUMNS.items():
+                columns = {row[1] for row in conn.execute(f'PRAGMA table_info({table})')}
+                if not columns:
+                    continue  # Table does not exist yet and will be created
+                
+                missing = [column for column in required_columns if column not in columns]
+                if missing:
+                    mismatches[table] = missing
+            
+            return mismatches
+        finally:
+            conn.close()
+    
+    @contextmanager
+    def transaction(self):
+        """
+        Group writes into one transaction, committed when the block exits
+        Nested blocks become savepoints; per-record commits inside are deferred
+        """
+        savepoint = f"sp_{self._transaction_depth}"
+        self.conn.execute("BEGIN IMMEDIATE" if self._transaction_depth == 0 else f"SAVEPOINT {savepoint}")
+        self._transaction_depth += 1
+        
+        try:
+            yield self.conn
+        except Exception:
+            self._transaction_depth -= 1
+            if self._transaction_depth == 0:
+                self.conn.rollback()
+            else:
+                self.conn.execute(f"ROLLBACK TO {savepoint}")
+                self.conn.execute(f"RELEASE {savepoint}")
+            raise
+        
+        self._transaction_depth -= 1
+        if self._transaction_depth == 0:
+            self.conn.commit()
+        else:
+            self.conn.execute(f"RELEASE {savepoint}")
+    
+    def _commit(self):
+        """Commit unless an enclosing transaction() block owns the commit"""
+        if self._transaction_depth == 0:
+            self.conn.commit()
+    
+    def _rollback(self):
+        """Roll back unless an enclosing transaction() block owns the rollback"""
+        if self._transaction_depth == 0:
+            self.conn.rollback()
+    
+    def parallel_insert_tables(self, table_rows: Dict[str, List[Dict[str, Any]]],
+                               max_workers: int = 4, batch_size: int = 500) -> Dict[str, int]:
+        """
+        Bulk insert rows into independent tables within a single transaction
+        Parameter rows are assembled column by column on worker threads while this
+        connection remains the only writer, issuing multi-row inserts of at most
+        batch_size rows
+        """
+        inserted = {}
+        
+        # Skip per-row foreign key probes during the trusted load; the pragma is
+        # a no-op inside a transaction, so it is switched before any insert
+        foreign_keys = self.conn.execute("PRAGMA foreign_keys").fetchone()[0]
+        self.conn.execute("PRAGMA foreign_keys=OFF")
+        
+        try:
+            with self.transaction(), ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = {
+                    executor.submit(self._prepare_bulk_rows, table, rows): table
+                    for table, rows in table_rows.items()
+                }
+                
+                # Build secondary indexes once after the load instead of per row
+                index_sql = self._drop_secondary_indexes(list(table_rows))
+                
+                for future in as_completed(futures):
+                    table = futures[future]
+                    columns, _ = _BULK_INSERT_TABLES[table]
+                    
+                    # The first column is the table's unique natural key
+                    inserted[table] = self.bulk_insert(
+                        table, columns, future.result(),
+                        suffix=f"ON CONFLICT({columns[0]}) DO NOTHING",
+                        batch_size=batch_size
+                    )
+                
+                for sql in index_sql:
+                    self.conn.execute(sql)
+            
+            for table in inserted:
+                violations = self.conn.execute(f"PRAGMA foreign_key_check({table})").fetchall()
+                if violations:
+                    logger.warning(f"{len(violations)} foreign key violations in {table} after bulk insert")
+            
+            logger.info(f"Bulk inserted rows: {inserted}")
+            return inserted
+            
+        except Exception as e:
+            logger.error(f"Failed to bulk insert tables: {str(e)}")
+            raise
+        finally:
+            self.conn.execute(f"PRAGMA foreign_keys={'ON' if foreign_keys else 'OFF'}")
+    
+    def bulk_insert(self, table: str, columns: Tuple[str, ...], rows: List[tuple],
+                    verb: str = 'INSERT', suffix: str = '', batch_size: int = None) -> int:
+        """
+        Insert parameter tuples with multi-row VALUES statements, returning rows changed
+        Each statement stays under SQLite's bound parameter limit; commits are left
+        to the caller's transaction
+        """
+        per_statement = max(1, _SQLITE_MAX_VARIABLES // len(columns))
+        if batch_size:
+            per_statement = min(per_statement, batch_size)
+        
+        changes = self.conn.total_changes
+        for start in range(0, len(rows), per_statement):
+            batch = rows[start:start + per_statement]
+            self.conn.execute(
+                _build_insert_sql(table, columns, verb, len(batch), suffix),
+                [value for row in batch for value in row]
+            )
+        
+        return self.conn.total_changes - changes
+    
+    @contextmanager
+    def deferred_indexes(self, tables: Optional[List[str]] = None):
+        """
+        Drop secondary indexes (on every table by default) for the duration of a bulk
+        load and rebuild each one once afterwards, even if the load fails
+        """
+        with self.transaction():
+            index_sql = self._drop_secondary_indexes(tables)
+        
+        try:
+            yield
+        finally:
+            with self.transaction():
+                for sql in index_sql:
+                    self.conn.execute(sql)
+            logger.info(f"Rebuilt {len(index_sql)} deferred indexes")
+    
+    def _drop_secondary_indexes(self, tables: Optional[List[str]] = None) -> List[str]:
+        """Drop explicit indexes on the given tables (or all), returning their DDL for re-creation"""
+        query = "SELECT name, sql FROM sqlite_master WHERE type = 'index' AND sql IS NOT NULL"
+        if tables is not None:
+            query += f" AND tbl_name IN ({', '.join('?' * len(tables))})"
+        indexes = self.conn.execute(query, tables or ()).fetchall()
+        
+        for index in indexes:
+            self.conn.execute(f"DROP INDEX {index['name']}")
+        
+        return [index['sql'] for index in indexes]
+    
+    @staticmethod
+    def _prepare_bulk_rows(table: str, rows: List[Dict[str, Any]]) -> List[tuple]:
+        """Build parameter tuples by filling one column at a time, then zipping"""
+        columns, json_columns = _BULK_INSERT_TABLES[table]
+        
+        # map(dict.get, ...) pulls each column in C while still tolerating optional keys
+        values = [
+            list(map(_json_column, map(dict.get, rows, repeat(column), repeat([]))))
+            if column in json_columns
+            else list(map(dict.get, rows, repeat(column)))
+            for column in columns
+        ]
+        
+        return list(zip(*values))
+    
     def _encrypt_privileged_data(self, data: str) -> str:
         """Encrypt privileged attorney-client data"""
         try:
             if isinstance(data, dict) or isinstance(data, list):
-                data = json.dumps(data)
+                return self.cipher.encrypt(orjson.dumps(data)).decode()
             return self.cipher.encrypt(data.encode()).decode()
         except Exception as e:
             logger.error(f"Failed to encrypt privileged data: {str(e)}")
@@ -392,27 +672,12 @@ class LegalDataManager:
     def create_attorney(self, attorney_data: Dict[str, Any]) -> bool:
         """Create a new attorney record"""
         try:
-            attorney_id = attorney_data.get('attorney_id', str(uuid.uuid4()))
+            row = self._attorney_row(attorney_data)
+            attorney_id = row[0]
             
-            self.conn.execute('''
-                INSERT OR REPLACE INTO attorneys 
-                (attorney_id, bar_number, first_name, last_name, law_firm, email, phone,
-                 practice_areas, jurisdiction, bar_admission_date, updated_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
-            ''', (
-                attorney_id,
-                attorney_data.get('bar_number'),
-                attorney_data.get('first_name'),
-                attorney_data.get('last_name'),
-                attorney_data.get('law_firm'),
-                attorney_data.get('email'),
-                attorney_data.get('phone'),
-                json.dumps(attorney_data.get('practice_areas', [])),
-                attorney_data.get('jurisdiction'),
-                attorney_data.get('bar_admission_date')
-            ))
+            self.conn.execute(_ATTORNEY_INSERT_SQL, row)
             
-            self.conn.commit()
+            self._commit()
             
             # Log attorney creation
             self.log_ethics_audit_event(
@@ -427,34 +692,18 @@ class LegalDataManager:
             
         except Exception as e:
             logger.error(f"Failed to create attorney: {str(e)}")
-            self.conn.rollback()
+            self._rollback()
             return False
     
     def create_client(self, client_data: Dict[str, Any]) -> bool:
         """Create a new client record"""
         try:
-            client_id = client_data.get('client_id', str(uuid.uuid4()))
+            row = self._client_row(client_data)
+            client_id = row[0]
             
-            self.conn.execute('''
-                INSERT OR REPLACE INTO clients 
-                (client_id, client_type, first_name, last_name, company_name, email, phone,
-                 address, case_matter_type, retainer_status, conflict_checked, updated_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
-            ''', (
-                client_id,
-                client_data.get('client_type', 'individual'),
-                client_data.get('first_name'),
-                client_data.get('last_name'),
-                client_data.get('company_name'),
-                client_data.get('email'),
-                client_data.get('phone'),
-                client_data.get('address'),
-                client_data.get('case_matter_type'),
-                client_data.get('retainer_status', 'pending'),
-                client_data.get('conflict_checked', False)
-            ))
+            self.conn.execute(_CLIENT_INSERT_SQL, row)
             
-            self.conn.commit()
+            self._commit()
             
             # Log client creation
             self.log_ethics_audit_event(
@@ -469,9 +718,88 @@ class LegalDataManager:
             
         except Exception as e:
             logger.error(f"Failed to create client: {str(e)}")
-            self.conn.rollback()
+            self._rollback()
             return False
     
+    def bulk_create_attorneys(self, attorneys: List[Dict[str, Any]]) -> List[str]:
+        """Create attorney records with multi-row inserts, logging their audit events in bulk"""
+        rows = [self._attorney_row(attorney) for attorney in attorneys]
+        
+        try:
+            with self.transaction():
+                self.bulk_insert('attorneys', _ATTORNEY_COLUMNS, rows, verb='INSERT OR REPLACE')
+                self.log_ethics_audit_events([
+                    {
+                        'attorney_id': row[0],
+                        'action_type': 'attorney_created',
+                        'action_description': 'New attorney record created',
+                        'compliance_status': 'compliant'
+                    }
+                    for row in rows
+                ])
+        except Exception as e:
+            logger.error(f"Failed to bulk create attorneys: {str(e)}")
+            raise
+        
+        logger.info(f"Created {len(rows)} attorneys")
+        return [row[0] for row in rows]
+    
+    def bulk_create_clients(self, clients: List[Dict[str, Any]]) -> List[str]:
+        """Create client records with multi-row inserts, logging their audit events in bulk"""
+        rows = [self._client_row(client) for client in clients]
+        
+        try:
+            with self.transaction():
+                self.bulk_insert('clients', _CLIENT_COLUMNS, rows, verb='INSERT OR REPLACE')
+                self.log_ethics_audit_events([
+                    {
+                        'client_id': row[0],
+                        'action_type': 'client_created',
+                        'action_description': 'New client record created',
+                        'compliance_status': 'compliant'
+                    }
+                    for row in rows
+                ])
+        except Exception as e:
+            logger.error(f"Failed to bulk create clients: {str(e)}")
+            raise
+        
+        logger.info(f"Created {len(rows)} clients")
+        return [row[0] for row in rows]
+    
+    @staticmethod
+    def _attorney_row(attorney_data: Dict[str, Any]) -> tuple:
+        """Build attorneys insert parameters"""
+        return (
+            attorney_data.get('attorney_id') or str(uuid.uuid4()),
+            attorney_data.get('bar_number'),
+            attorney_data.get('first_name'),
+            attorney_data.get('last_name'),
+            attorney_data.get('law_firm'),
+            attorney_data.get('email'),
+            attorney_data.get('phone'),
+            _json_column(attorney_data.get('practice_areas', [])),
+            attorney_data.get('jurisdiction'),
+            attorney_data.get('bar_admission_date')
+        )
+    
+    @staticmethod
+    def _client_row(client_data: Dict[str, Any]) -> tuple:
+        """Build clients insert parameters"""
+        return (
+            client_data.get('client_id') or str(uuid.uuid4()),
+            client_data.get('client_type', 'individual'),
+            client_data.get('first_name'),
+            client_data.get('last_name'),
+            client_data.get('company_name'),
+            client_data.get('email'),
+            client_data.get('phone'),
+            client_data.get('address'),
+            client_data.get('case_matter_type'),
+            client_data.get('retainer_status', 'pending'),
+            client_data.get('conflict_checked', False)
+        )
+    
     def create_attorney_client_relationship(self, attorney_id: str, client_id: str,
                                           relationship_data: Dict[str, Any]) -> str:
         """Create attorney-client relationship with privilege protection"""
@@ -482,29 +810,21 @@ class LegalDataManager:
             if not self.get_attorney(attorney_id) or not self.get_client(client_id):
                 raise ValueError("Attorney or client not found")
             
+            # Fail fast on an existing pair, before the conflict check writes its audit entry
+            if self.relationship_exists(attorney_id, client_id):
+                raise ValueError("Attorney-client relationship already exists")
+            
             # Check for conflicts of interest
             conflict_check_result = self.check_conflicts_of_interest(attorney_id, client_id)
             if not conflict_check_result['can_represent']:
                 raise ValueError(f"Conflict of interest detected: {conflict_check_result['conflict_reason']}")
             
-            self.conn.execute('''
-                INSERT INTO attorney_client_relationships 
-                (relationship_id, attorney_id, client_id, matter_description, engagement_date,
-                 relationship_status, privilege_status, retainer_amount, billing_rate, updated_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
-            ''', (
-                relationship_id,
-                attorney_id,
-                client_id,
-                relationship_data.get('matter_description'),
-                relationship_data.get('engagement_date', datetime.now().date()),
-                relationship_data.get('relationship_status', 'active'),
-                relationship_data.get('privilege_status', 'privileged'),
-                relationship_data.get('retainer_amount'),
-                relationship_data.get('billing_rate')
-            ))
+            self.conn.execute(
+                _RELATIONSHIP_INSERT_SQL,
+                self._relationship_row(relationship_id, attorney_id, client_id, relationship_data)
+            )
             
-            self.conn.commit()
+            self._commit()
             
             # Log relationship creation
             self.log_ethics_audit_event(
@@ -521,9 +841,127 @@ class LegalDataManager:
             
         except Exception as e:
             logger.error(f"Failed to create attorney-client relationship: {str(e)}")
-            self.conn.rollback()
+            self._rollback()
             raise
     
+    def relationship_exists(self, attorney_id: str, client_id: str) -> bool:
+        """Check whether the pair has a relationship in any status, via its unique index"""
+        return self.conn.execute(
+            'SELECT 1 FROM attorney_client_relationships WHERE attorney_id = ? AND client_id = ?',
+            (attorney_id, client_id)
+        ).fetchone() is not None
+    
+    def bulk_create_attorney_client_relationships(
+            self, relationships: List[Tuple[str, str, Dict[str, Any]]]) -> List[Tuple[str, str]]:
+        """
+        Create (attorney_id, client_id, relationship_data) relationships in one transaction
+        Existence, duplicate and conflict-of-interest checks run in memory against one
+        lookup per table; rejected pairs are skipped. Returns the created pairs
+        """
+        attorney_ids = orjson.dumps(sorted({attorney_id for attorney_id, _, _ in relationships})).decode()
+        client_ids = orjson.dumps(sorted({client_id for _, client_id, _ in relationships})).decode()
+        
+        known_attorneys = {row[0] for row in self.conn.execute(
+            "SELECT attorney_id FROM attorneys WHERE attorney_id IN (SELECT value FROM json_each(?))",
+            (attorney_ids,)
+        )}
+        client_companies = dict(self.conn.execute(
+            "SELECT client_id, company_name FROM clients WHERE client_id IN (SELECT value FROM json_each(?))",
+            (client_ids,)
+        ).fetchall())
+        
+        # Pairs in any status (the unique index covers them all), plus the active clients
+        # per attorney, the same view check_conflicts_of_interest uses
+        existing_pairs = set()
+        existing = {}
+        for attorney_id, client_id, company_name, status in self.conn.execute('''
+            SELECT r.attorney_id, r.client_id, c.company_name, r.relationship_status
+            FROM attorney_client_relationships r
+            LEFT JOIN clients c ON c.client_id = r.client_id
+            WHERE r.attorney_id IN (SELECT value FROM json_each(?))
+        ''', (attorney_ids,)):
+            existing_pairs.add((attorney_id, client_id))
+            if status == 'active':
+                existing.setdefault(attorney_id, {})[client_id] = company_name
+        
+        rows = []
+        audit_events = []
+        relationship_ids = iter(uuid4_batch(len(relationships)))
+        for attorney_id, client_id, relationship_data in relationships:
+            if attorney_id not in known_attorneys or client_id not in client_companies:
+                logger.debug("Skipping relationship %s/%s: attorney or client not found", attorney_id, client_id)
+                continue
+            
+            current_clients = existing.setdefault(attorney_id, {})
+            if (attorney_id, client_id) in existing_pairs:
+                logger.debug("Skipping relationship %s/%s: relationship already exists", attorney_id, client_id)
+                continue
+            
+            company_name = client_companies[client_id]
+            conflicts = [
+                {
+                    'type': 'potential_business_conflict',
+                    'description': f'Same company name as existing client: {existing_company}'
+                }
+                for existing_company in current_clients.values()
+                if company_name and existing_company and company_name.lower() == existing_company.lower()
+            ]
+            audit_events.append({
+                'attorney_id': attorney_id,
+                'client_id': client_id,
+                'action_type': 'conflict_check_performed',
+                'action_description': f'Conflict check completed: {len(conflicts)} potential conflicts found',
+                'compliance_status': 'compliant',
+                'conflict_impact': True,
+                'audit_details': orjson.dumps({
+                    'conflicts_found': len(conflicts),
+                    'conflict_details': conflicts
+                }).decode()
+            })
+            if conflicts:
+                logger.debug("Skipping relationship %s/%s: %s", attorney_id, client_id, conflicts[0]['description'])
+                continue
+            
+            relationship_id = next(relationship_ids)
+            rows.append(self._relationship_row(relationship_id, attorney_id, client_id, relationship_data))
+            current_clients[client_id] = company_name
+            existing_pairs.add((attorney_id, client_id))
+            audit_events.append({
+                'attorney_id': attorney_id,
+                'client_id': client_id,
+                'action_type': 'attorney_client_relationship_created',
+                'action_description': f'Attorney-client relationship established: {relationship_id}',
+                'compliance_status': 'compliant',
+                'privilege_impact': True
+            })
+        
+        try:
+            with self.transaction():
+                self.bulk_insert('attorney_client_relationships', _RELATIONSHIP_COLUMNS, rows)
+                self.log_ethics_audit_events(audit_events)
+        except Exception as e:
+            logger.error(f"Failed to bulk create attorney-client relationships: {str(e)}")
+            raise
+        
+        logger.info(f"Created {len(rows)} of {len(relationships)} attorney-client relationships")
+        return [(row[1], row[2]) for row in rows]
+    
+    @staticmethod
+    def _relationship_row(relationship_id: str, attorney_id: str, client_id: str,
+                          relationship_data: Dict[str, Any]) -> tuple:
+        """Build attorney_client_relationships insert parameters"""
+        return (
+            relationship_id,
+            attorney_id,
+            client_id,
+            relationship_data.get('matter_description'),
+            relationship_data.get('engagement_date', datetime.now().date()),
+            relationship_data.get('relationship_status', 'active'),
+            relationship_data.get('privilege_status', 'privileged'),
+            relationship_data.get('retainer_amount'),
+            relationship_data.get('billing_rate')
+        )
+    
     def verify_attorney_client_relationship(self, attorney_id: str, client_id: str) -> bool:
         """Verify if valid attorney-client relationship exists"""
         try:
@@ -581,19 +1019,19 @@ class LegalDataManager:
                 encrypted_content,
                 communication_data.get('communication_date', datetime.now()),
                 communication_data.get('duration_minutes'),
-                json.dumps(communication_data.get('participants', [])),
+                orjson.dumps(communication_data.get('participants', [])).decode(),
                 communication_data.get('privilege_level', 'full_privilege'),
                 communication_data.get('work_product_protection', True),
                 communication_data.get('confidentiality_level', 'attorney_client'),
                 communication_data.get('retention_policy', 'client_relationship_plus_7_years'),
-                json.dumps([{
+                orjson.dumps([{
                     'timestamp': datetime.now().isoformat(),
                     'action': 'created',
                     'user': attorney_id
-                }])
+                }]).decode()
             ))
             
-            self.conn.commit()
+            self._commit()
             
             # Log privileged communication storage
             self.log_ethics_audit_event(
@@ -611,7 +1049,7 @@ class LegalDataManager:
             
         except Exception as e:
             logger.error(f"Failed to store privileged communication: {str(e)}")
-            self.conn.rollback()
+            self._rollback()
             raise
     
     def get_privileged_communications(self, attorney_id: str, client_id: str,
@@ -647,7 +1085,7 @@ class LegalDataManager:
                 # Decrypt content for authorized access
                 try:
                     decrypted_content = self._decrypt_privileged_data(communication['encrypted_content'])
-                    communication['content'] = json.loads(decrypted_content)
+                    communication['content'] = orjson.loads(decrypted_content)
                 except Exception as e:
                     logger.error(f"Failed to decrypt communication {communication['communication_id']}: {str(e)}")
                     continue
@@ -697,7 +1135,7 @@ class LegalDataManager:
             
             result = cursor.fetchone()
             if result:
-                access_log = json.loads(result[0] or '[]')
+                access_log = orjson.loads(result[0] or '[]')
                 access_log.append({
                     'timestamp': datetime.now().isoformat(),
                     'action': 'accessed',
@@ -709,9 +1147,9 @@ class LegalDataManager:
                     UPDATE privileged_communications 
                     SET access_log = ?
                     WHERE communication_id = ?
-                ''', (json.dumps(access_log), communication_id))
+                ''', (orjson.dumps(access_log).decode(), communication_id))
                 
-                self.conn.commit()
+                self._commit()
                 
         except Exception as e:
             logger.error(f"Failed to log privileged access: {str(e)}")
@@ -763,10 +1201,10 @@ class LegalDataManager:
                 action_description=f'Conflict check completed: {len(conflicts)} potential conflicts found',
                 compliance_status='compliant',
                 conflict_impact=True,
-                audit_details=json.dumps({
+                audit_details=orjson.dumps({
                     'conflicts_found': len(conflicts),
                     'conflict_details': conflicts
-                })
+                }).decode()
             )
             
             can_represent = len(conflicts) == 0 or all(c['type'] == 'existing_client' for c in conflicts)
@@ -819,7 +1257,7 @@ class LegalDataManager:
                 interaction_data.get('session_id')
             ))
             
-            self.conn.commit()
+            self._commit()
             
             # Log AI interaction
             self.log_ethics_audit_event(
@@ -835,7 +1273,7 @@ class LegalDataManager:
             
         except Exception as e:
             logger.error(f"Failed to store AI interaction: {str(e)}")
-            self.conn.rollback()
+            self._rollback()
             raise
     
     def log_ethics_audit_event(self, action_type: str, action_description: str,
@@ -843,49 +1281,61 @@ class LegalDataManager:
                              client_id: str = None, **kwargs) -> str:
         """Log ethics compliance audit event"""
         try:
-            audit_id = str(uuid.uuid4())
-            
-            audit_details = {
-                'privilege_impact': kwargs.get('privilege_impact', False),
-                'confidentiality_impact': kwargs.get('confidentiality_impact', False),
-                'conflict_impact': kwargs.get('conflict_impact', False),
-                'additional_details': kwargs.get('audit_details', {}),
-                'timestamp': datetime.now().isoformat()
-            }
+            row = self._ethics_audit_row(action_type, action_description, compliance_status,
+                                         attorney_id, client_id, **kwargs)
             
-            self.conn.execute('''
-                INSERT INTO ethics_audit_log 
-                (audit_id, attorney_id, client_id, action_type, action_description,
-                 compliance_rule, compliance_status, privilege_impact, confidentiality_impact,
-                 conflict_impact, audit_details, remedial_action, responsible_attorney,
-                 review_required, ip_address, user_agent)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                audit_id,
-                attorney_id,
-                client_id,
-                action_type,
-                action_description,
-                kwargs.get('compliance_rule'),
-                compliance_status,
-                kwargs.get('privilege_impact', False),
-                kwargs.get('confidentiality_impact', False),
-                kwargs.get('conflict_impact', False),
-                json.dumps(audit_details),
-                kwargs.get('remedial_action'),
-                kwargs.get('responsible_attorney', attorney_id),
-                kwargs.get('review_required', compliance_status == 'violation'),
-                kwargs.get('ip_address'),
-                kwargs.get('user_agent')
-            ))
+            self.conn.execute(_ETHICS_AUDIT_INSERT_SQL, row)
             
-            self.conn.commit()
-            return audit_id
+            self._commit()
+            return row[0]
             
         except Exception as e:
             logger.error(f"Failed to log ethics audit event: {str(e)}")
             return None
     
+    def log_ethics_audit_events(self, events: List[Dict[str, Any]]) -> List[str]:
+        """Log many ethics compliance audit events with multi-row inserts"""
+        rows = [
+            self._ethics_audit_row(audit_id=audit_id, **event)
+            for audit_id, event in zip(uuid4_batch(len(events)), events)
+        ]
+        
+        self.bulk_insert('ethics_audit_log', _ETHICS_AUDIT_COLUMNS, rows)
+        self._commit()
+        
+        return [row[0] for row in rows]
+    
+    @staticmethod
+    def _ethics_audit_row(action_type: str, action_description: str, compliance_status: str,
+                          attorney_id: str = None, client_id: str = None, **kwargs) -> tuple:
+        """Build ethics_audit_log insert parameters"""
+        audit_details = {
+            'privilege_impact': kwargs.get('privilege_impact', False),
+            'confidentiality_impact': kwargs.get('confidentiality_impact', False),
+            'conflict_impact': kwargs.get('conflict_impact', False),
+            'additional_details': kwargs.get('audit_details', {}),
+            'timestamp': datetime.now().isoformat()
+        }
+        
+        return (
+            kwargs.get('audit_id') or str(uuid.uuid4()),
+            attorney_id,
+            client_id,
+            action_type,
+            action_description,
+            kwargs.get('compliance_rule'),
+            compliance_status,
+            kwargs.get('privilege_impact', False),
+            kwargs.get('confidentiality_impact', False),
+            kwargs.get('conflict_impact', False),
+            orjson.dumps(audit_details).decode(),
+            kwargs.get('remedial_action'),
+            kwargs.get('responsible_attorney', attorney_id),
+            kwargs.get('review_required', compliance_status == 'violation'),
+            kwargs.get('ip_address'),
+            kwargs.get('user_agent')
+        )
+    
     def get_attorney(self, attorney_id: str) -> Optional[Dict]:
         """Retrieve attorney information"""
         try:
@@ -902,7 +1352,7 @@ class LegalDataManager:
             # Parse JSON fields
             if attorney['practice_areas']:
                 try:
-                    attorney['practice_areas'] = json.loads(attorney['practice_areas'])
+                    attorney['practice_areas'] = orjson.loads(attorney['practice_areas'])
                 except:
                     attorney['practice_areas'] = []
             
@@ -976,7 +1426,7 @@ class LegalDataManager:
                 # Parse JSON fields
                 if case['legal_issues']:
                     try:
-                        case['legal_issues'] = json.loads(case['legal_issues'])
+                        case['legal_issues'] = orjson.loads(case['legal_issues'])
                     except:
                         case['legal_issues'] = [case['legal_issues']]
                 
@@ -1033,7 +1483,7 @@ class LegalDataManager:
                 for field in ['keywords', 'practice_areas']:
                     if statute[field]:
                         try:
-                            statute[field] = json.loads(statute[field])
+                            statute[field] = orjson.loads(statute[field])
                         except:
                             statute[field] = [statute[field]]
                 
@@ -1146,27 +1596,30 @@ class LegalDataManager:
             return False
     
     def get_database_stats(self) -> Dict[str, int]:
-        """Get legal database statistics"""
+        """
+        Get legal database statistics
+        Counts are cached until the next write, so repeated calls between writes skip
+        the table scans. total_changes covers writes through this connection and
+        data_version covers commits from other connections or processes
+        """
         try:
-            stats = {}
-            
-            tables = [
-                'attorneys', 'clients', 'attorney_client_relationships', 'legal_cases',
-                'privileged_communications', 'legal_documents', 'case_law', 'statutes',
-                'legal_precedents', 'contract_templates', 'ethics_audit_log', 'ai_interactions'
-            ]
+            changes = (self.conn.execute("PRAGMA data_version").fetchone()[0], self.conn.total_changes)
+            if self._stats_cache and self._stats_cache[0] == changes:
+                return dict(self._stats_cache[1])
             
-            for table in tables:
-                cursor = self.conn.execute(f'SELECT COUNT(*) FROM {table}')
-                stats[table] = cursor.fetchone()[0]
+            # One statement counts every table instead of a round trip per table
+            row = self.conn.execute(
+                'SELECT ' + ', '.join(f'(SELECT COUNT(*) FROM {table})' for table in _STATS_TABLES)
+            ).fetchone()
+            stats = dict(zip(_STATS_TABLES, row))
             
-            return stats
+            self._stats_cache = (changes, stats)
+            return dict(stats)
             
         except Exception as e:
             logger.error(f"Failed to get legal database stats: {str(e)}")
             return {}
     
-<<<<<<< HEAD
     # Additional methods needed by the main app
     def store_legal_research(self, attorney_id: str, client_id: str, query: str, 
                            research_result: Dict[str, Any], jurisdiction: str) -> bool:
@@ -1312,10 +1765,23 @@ class LegalDataManager:
             logger.error(f"Failed to log privileged audit event: {str(e)}")
             return False
 
-=======
->>>>>>> 6c3aac01d38711e21958dc83ff6d611bbc727be6
     def close(self):
-        """Close database connection"""
+        """Close database connection, first refreshing planner statistics where they have gone stale"""
         if self.conn:
+            self.conn.execute("PRAGMA optimize")
             self.conn.close()
-            logger.info("Legal database connection closed")
\ No newline at end of file
+            self.conn = None  # the shared manager may be closed by more than one caller
+            logger.info("Legal database connection closed")
+
+@lru_cache(maxsize=None)
+def _shared_legal_data_manager(db_path: str) -> LegalDataManager:
+    """Open one LegalDataManager per absolute database path"""
+    return LegalDataManager(db_path)
+
+def get_legal_data_manager(db_path: str = "./legal_data.db") -> LegalDataManager:
+    """
+    Return the process-wide LegalDataManager for db_path
+    Callers share its connection, schema setup and encryption key instead of each
+    opening their own manager
+    """
+    return _shared_legal_data_manager(os.path.abspath(db_path))
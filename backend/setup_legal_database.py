@@ -6,18 +6,23 @@ Initializes SQLite database with sample legal data and ChromaDB with legal knowl
 
 import os
 import sys
+import argparse
 import logging
-from datetime import datetime, timedelta
-from typing import Dict, Any, List
-import uuid
-import json
+import random
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Tuple
+import orjson
 from faker import Faker
 
 # Add backend to path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from database.sqlite_legal_manager import LegalDataManager
-from database.chromadb_legal_manager import LegalKnowledgeStore
+from database.chromadb_legal_manager import LegalKnowledgeStore, get_legal_knowledge_store
+from utils.ids import uuid4_batch
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -26,20 +31,168 @@ logger = logging.getLogger(__name__)
 # Initialize Faker for generating sample data
 fake = Faker()
 
+# Bulk load tuning: rows per multi-row INSERT (further capped by SQLite's bound
+# parameter limit), and WAL pages between automatic checkpoints (raised so
+# checkpoints do not stall the load midway)
+BULK_BATCH_SIZE = 100
+WAL_AUTOCHECKPOINT_PAGES = 10000
+
+# Page size for newly created databases and the memory-mapped read window
+PAGE_SIZE = 16384
+MMAP_SIZE = 536870912
+
+# Rows generated per seeding phase
+SEED_COUNTS = {
+    'attorneys': 15,
+    'clients': 30,
+    'attorney_client_relationships': 25,
+    'case_law': 100,
+    'statutes': 50,
+    'legal_precedents': 75,
+    'contract_templates': 25,
+    'ai_interactions': 50
+}
+
+# Tables whose row counts show that a previous run completed the load
+SEED_CHECK_TABLES = ('attorneys', 'clients', 'case_law', 'statutes', 'legal_precedents')
+
+# Curated reference knowledge shipped with the backend
+KNOWLEDGE_ASSET_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'legal_knowledge.json')
+
+# Sample value pools, built once at import instead of per generated row
+JURISDICTIONS = ('Federal', 'California', 'New York', 'Texas', 'Florida')
+KNOWLEDGE_JURISDICTIONS = ('Federal', 'California', 'New York', 'Texas')
+CONTRACT_JURISDICTIONS = ('Federal', 'California', 'New York', 'Delaware')
+
+ATTORNEY_PRACTICE_AREAS = (
+    'Corporate Law', 'Litigation', 'Real Estate', 'Employment Law',
+    'Family Law', 'Criminal Law', 'Immigration', 'Intellectual Property'
+)
+INDIVIDUAL_MATTER_TYPES = ('Civil Litigation', 'Family Law', 'Criminal Defense', 'Personal Injury')
+CORPORATE_MATTER_TYPES = ('Corporate Transactions', 'Employment Law', 'Intellectual Property', 'Regulatory Compliance')
+
+LEGAL_ISSUES = (
+    "Contract interpretation", "Negligence liability", "Constitutional rights",
+    "Employment discrimination", "Intellectual property infringement", "Corporate governance",
+    "Criminal procedure", "Evidence admissibility", "Jurisdiction disputes", "Standing to sue",
+    "Due process violations", "First Amendment rights", "Search and seizure",
+    "Miranda rights", "Double jeopardy", "Statute of limitations", "Breach of fiduciary duty",
+    "Securities fraud", "Antitrust violations", "Environmental liability"
+)
+COURTS = (
+    "Supreme Court", "9th Circuit Court of Appeals", "2nd Circuit Court of Appeals",
+    "District Court for SDNY", "District Court for NDCA", "California Supreme Court",
+    "New York Court of Appeals", "Texas Supreme Court", "Florida Supreme Court"
+)
+CASE_PRACTICE_AREAS = ('Corporate Law', 'Litigation', 'Constitutional Law', 'Criminal Law', 'Civil Rights')
+
+STATUTE_TITLES = (
+    "Civil Rights Act", "Americans with Disabilities Act", "Securities Exchange Act",
+    "Fair Labor Standards Act", "Clean Air Act", "Sarbanes-Oxley Act",
+    "Employee Retirement Income Security Act", "Immigration and Nationality Act",
+    "Telecommunications Act", "Copyright Act", "Patent Act", "Trademark Act"
+)
+STATUTE_KEYWORDS = ('regulation', 'compliance', 'enforcement', 'liability', 'procedure', 'rights')
+STATUTE_PRACTICE_AREAS = ('Corporate Law', 'Employment Law', 'Environmental Law', 'Securities Law')
+
+LEGAL_PRINCIPLES = (
+    "Duty of care in negligence", "Reasonable expectation of privacy", "Freedom of speech protection",
+    "Due process requirements", "Equal protection under law", "Commerce Clause authority",
+    "Executive privilege limitations", "Judicial review scope", "Contract formation requirements",
+    "Good faith and fair dealing", "Fiduciary duty standards", "Corporate veil piercing"
+)
+PRECEDENT_PRACTICE_AREAS = ('Constitutional Law', 'Corporate Law', 'Civil Rights', 'Criminal Law')
+
+CONTRACT_TYPES = (
+    'Employment Agreement', 'Non-Disclosure Agreement', 'Service Agreement',
+    'Purchase Agreement', 'Lease Agreement', 'Partnership Agreement',
+    'License Agreement', 'Merger Agreement', 'Loan Agreement'
+)
+STANDARD_CLAUSES = ('Termination', 'Confidentiality', 'Governing Law', 'Dispute Resolution', 'Force Majeure')
+OPTIONAL_CLAUSES = ('Non-Compete', 'Indemnification', 'Assignment', 'Amendment')
+
+AGENT_TYPES = ('legal_research', 'case_analysis', 'document_review', 'precedent_mining')
+
+# Generated Faker texts per pool; seed rows draw from these instead of calling
+# the (slow, pure Python) providers once per field
+FAKE_POOL_SIZE = 50
+
+@lru_cache(maxsize=None)
+def _fake_pool(provider: str, seed: Optional[int] = None, size: int = FAKE_POOL_SIZE,
+               **kwargs) -> Tuple[Any, ...]:
+    """
+    Generate and cache size values from a Faker provider
+    With a seed, each pool gets its own Faker seeded from the seed and the pool's
+    arguments, so its contents do not depend on which pools were built first
+    """
+    generator = fake
+    if seed is not None:
+        generator = Faker()
+        generator.seed_instance(f"{seed}:{provider}:{size}:{sorted(kwargs.items())}")
+    return tuple(getattr(generator, provider)(**kwargs) for _ in range(size))
+
+# Faker pools the concurrent knowledge phases draw from, as (provider, arguments)
+_KNOWLEDGE_FAKE_POOLS = (
+    ('last_name', {}),
+    ('paragraph', {'nb_sentences': 2}),
+    ('paragraph', {'nb_sentences': 3}),
+    ('paragraph', {'nb_sentences': 4}),
+    ('paragraph', {'nb_sentences': 5}),
+    ('paragraph', {'nb_sentences': 8}),
+    ('paragraph', {'nb_sentences': 10})
+)
+
+def _random_past_date(rng: random.Random, max_years: int) -> date:
+    """Pick a date between max_years ago and today"""
+    return date.today() - timedelta(days=rng.randint(0, max_years * 365))
+
 class LegalDatabaseSeeder:
     """Seeds legal database with sample data for development and testing"""
     
-    def __init__(self):
-        """Initialize database managers"""
-        self.legal_db = LegalDataManager()
-        self.knowledge_store = LegalKnowledgeStore()
+    def __init__(self, db_path: str = "./legal_data.db", fast: bool = False, seed: Optional[int] = None):
+        """
+        Initialize database managers
+        fast trades crash durability for load speed (in-memory rollback journal, no
+        fsync); only use it for throwaway development databases that can be reseeded.
+        seed makes the generated knowledge, relationship and interaction rows reproducible
+        """
+        self.seed = seed
+        
+        # Larger pages mean fewer B-tree splits while loading; the page size can
+        # only be chosen before the first table is written
+        if not os.path.exists(db_path):
+            conn = sqlite3.connect(db_path)
+            conn.execute(f"PRAGMA page_size={PAGE_SIZE}")
+            conn.execute("VACUUM")
+            conn.close()
+        
+        # The seeder keeps a dedicated connection, since it takes an exclusive lock
+        self.legal_db = LegalDataManager(db_path)
+        
+        # Append-only WAL with relaxed syncing and a larger page cache for the bulk load.
+        # The seeder is the only writer, so it holds the file lock for the whole session
+        # (which also keeps the WAL index in heap memory instead of a -shm file)
+        self.legal_db.conn.executescript(
+            "PRAGMA locking_mode=EXCLUSIVE; "
+            f"PRAGMA journal_mode={'MEMORY' if fast else 'WAL'}; "
+            f"PRAGMA synchronous={'OFF' if fast else 'NORMAL'}; "
+            "PRAGMA temp_store=MEMORY; "
+            "PRAGMA cache_size=-64000; "
+            f"PRAGMA mmap_size={MMAP_SIZE};"
+        )
+        
+        # Checkpoint less often during the load; run_full_seed truncates the WAL at the end
+        self.legal_db.conn.execute(f"PRAGMA wal_autocheckpoint={WAL_AUTOCHECKPOINT_PAGES}")
         
+    @property
+    def knowledge_store(self) -> LegalKnowledgeStore:
+        """Shared ChromaDB store, loaded on first use so SQLite-only seeding skips the embedder"""
+        return get_legal_knowledge_store()
+    
     def seed_attorneys(self, count: int = 10) -> List[str]:
         """Create sample attorney records"""
-        attorney_ids = []
-        
-        for i in range(count):
-            attorney_data = {
+        attorneys = [
+            {
                 'attorney_id': f"attorney_{i+1:03d}",
                 'bar_number': f"BAR{fake.random_int(10000, 99999)}",
                 'first_name': fake.first_name(),
@@ -48,23 +201,21 @@ class LegalDatabaseSeeder:
                 'email': fake.email(),
                 'phone': fake.phone_number(),
                 'practice_areas': fake.random_elements(
-                    elements=['Corporate Law', 'Litigation', 'Real Estate', 'Employment Law', 
-                             'Family Law', 'Criminal Law', 'Immigration', 'Intellectual Property'],
+                    elements=ATTORNEY_PRACTICE_AREAS,
                     length=fake.random_int(1, 3)
                 ),
-                'jurisdiction': fake.random_element(['Federal', 'California', 'New York', 'Texas', 'Florida']),
+                'jurisdiction': fake.random_element(JURISDICTIONS),
                 'bar_admission_date': fake.date_between(start_date='-20y', end_date='-2y')
             }
-            
-            if self.legal_db.create_attorney(attorney_data):
-                attorney_ids.append(attorney_data['attorney_id'])
-                logger.info(f"Created attorney: {attorney_data['first_name']} {attorney_data['last_name']}")
+            for i in range(count)
+        ]
         
-        return attorney_ids
+        return self.legal_db.bulk_create_attorneys(attorneys)
     
     def seed_clients(self, count: int = 25) -> List[str]:
         """Create sample client records"""
-        client_ids = []
+        clients = []
+        addresses = _fake_pool('address', seed=self.seed)
         
         for i in range(count):
             client_type = fake.random_element(['individual', 'corporate'])
@@ -77,8 +228,8 @@ class LegalDatabaseSeeder:
                     'last_name': fake.last_name(),
                     'email': fake.email(),
                     'phone': fake.phone_number(),
-                    'address': fake.address(),
-                    'case_matter_type': fake.random_element(['Civil Litigation', 'Family Law', 'Criminal Defense', 'Personal Injury']),
+                    'address': fake.random_element(addresses),
+                    'case_matter_type': fake.random_element(INDIVIDUAL_MATTER_TYPES),
                     'retainer_status': fake.random_element(['paid', 'pending', 'overdue']),
                     'conflict_checked': True
                 }
@@ -89,234 +240,309 @@ class LegalDatabaseSeeder:
                     'company_name': fake.company(),
                     'email': fake.company_email(),
                     'phone': fake.phone_number(),
-                    'address': fake.address(),
-                    'case_matter_type': fake.random_element(['Corporate Transactions', 'Employment Law', 'Intellectual Property', 'Regulatory Compliance']),
+                    'address': fake.random_element(addresses),
+                    'case_matter_type': fake.random_element(CORPORATE_MATTER_TYPES),
                     'retainer_status': fake.random_element(['paid', 'pending']),
                     'conflict_checked': True
                 }
             
-            if self.legal_db.create_client(client_data):
-                client_ids.append(client_data['client_id'])
-                logger.info(f"Created client: {client_data.get('company_name') or client_data.get('first_name', '') + ' ' + client_data.get('last_name', '')}")
+            clients.append(client_data)
         
-        return client_ids
+        return self.legal_db.bulk_create_clients(clients)
     
-    def seed_attorney_client_relationships(self, attorney_ids: List[str], client_ids: List[str], count: int = 20):
-        """Create attorney-client relationships"""
-        for i in range(count):
-            attorney_id = fake.random_element(attorney_ids)
-            client_id = fake.random_element(client_ids)
-            
-            # Avoid duplicate relationships
-            try:
-                relationship_data = {
-                    'matter_description': fake.text(max_nb_chars=200),
-                    'engagement_date': fake.date_between(start_date='-2y', end_date='today'),
-                    'relationship_status': 'active',
-                    'privilege_status': 'privileged',
-                    'retainer_amount': fake.pydecimal(left_digits=5, right_digits=2, positive=True),
-                    'billing_rate': fake.pydecimal(left_digits=3, right_digits=2, positive=True)
-                }
-                
-                relationship_id = self.legal_db.create_attorney_client_relationship(
-                    attorney_id, client_id, relationship_data
-                )
-                logger.info(f"Created relationship {relationship_id} between {attorney_id} and {client_id}")
-                
-            except Exception as e:
-                logger.debug(f"Relationship already exists or conflict detected: {str(e)}")
-                continue
+    def seed_attorney_client_relationships(self, attorney_ids: List[str], client_ids: List[str],
+                                           count: int = 20) -> List[Tuple[str, str]]:
+        """Create attorney-client relationships, returning the (attorney_id, client_id) pairs created"""
+        rng = random.Random(self.seed)
+        matter_descriptions = _fake_pool('text', seed=self.seed, max_nb_chars=200)
+        
+        # Draw distinct pairs up front so duplicates never reach the database
+        pairs = rng.sample(
+            [(attorney_id, client_id) for attorney_id in attorney_ids for client_id in client_ids],
+            k=min(count, len(attorney_ids) * len(client_ids))
+        )
+        
+        relationships = [
+            (attorney_id, client_id, {
+                'matter_description': rng.choice(matter_descriptions),
+                'engagement_date': _random_past_date(rng, 2),
+                'relationship_status': 'active',
+                'privilege_status': 'privileged',
+                'retainer_amount': round(rng.uniform(1000, 99999), 2),
+                'billing_rate': round(rng.uniform(100, 999), 2)
+            })
+            for attorney_id, client_id in pairs
+        ]
+        
+        # Conflict-of-interest rejections and relationships left by an earlier seed
+        # run are skipped in memory rather than failing per insert
+        return self.legal_db.bulk_create_attorney_client_relationships(relationships)
+    
+    def load_reference_knowledge(self, path: str = KNOWLEDGE_ASSET_PATH) -> Dict[str, List[Dict[str, Any]]]:
+        """Load curated legal knowledge into ChromaDB and return it as SQLite mirror rows"""
+        logger.info("Loading reference legal knowledge...")
+        
+        with open(path, 'rb') as f:
+            knowledge = orjson.loads(f.read())
+        
+        # Map the asset's field names onto the SQLite knowledge columns, filling the
+        # column defaults the bulk insert would otherwise bind as NULL
+        case_law = [
+            {'overruled': False, 'citation_count': 0, **case, 'case_law_id': case['case_id'], 'key_facts': case.get('facts')}
+            for case in knowledge.get('case_law', [])
+        ]
+        statutes = [
+            {**statute, 'practice_areas': statute.get('legal_areas', [])}
+            for statute in knowledge.get('statutes', [])
+        ]
+        precedents = [
+            {'overruled': False, **precedent, 'case_law_id': precedent.get('case_id')}
+            for precedent in knowledge.get('legal_precedents', [])
+        ]
+        
+        self.knowledge_store.add_case_law_batch(case_law)
+        self.knowledge_store.add_statute_batch(statutes)
+        self.knowledge_store.add_precedent_batch(precedents)
+        self.knowledge_store.add_contract_template_batch(knowledge.get('contract_templates', []))
+        
+        logger.info("Loaded reference knowledge: case_law=%d statutes=%d precedents=%d",
+                    len(case_law), len(statutes), len(precedents))
+        return {'case_law': case_law, 'statutes': statutes, 'legal_precedents': precedents}
     
-    def seed_case_law_knowledge(self, count: int = 100):
+    def seed_case_law_knowledge(self, count: int = 100) -> List[Dict[str, Any]]:
         """Seed ChromaDB with sample case law"""
         logger.info("Seeding case law knowledge...")
         
-        legal_issues_pool = [
-            "Contract interpretation", "Negligence liability", "Constitutional rights", 
-            "Employment discrimination", "Intellectual property infringement", "Corporate governance",
-            "Criminal procedure", "Evidence admissibility", "Jurisdiction disputes", "Standing to sue",
-            "Due process violations", "First Amendment rights", "Search and seizure",
-            "Miranda rights", "Double jeopardy", "Statute of limitations", "Breach of fiduciary duty",
-            "Securities fraud", "Antitrust violations", "Environmental liability"
-        ]
+        case_law = []
         
-        courts_pool = [
-            "Supreme Court", "9th Circuit Court of Appeals", "2nd Circuit Court of Appeals",
-            "District Court for SDNY", "District Court for NDCA", "California Supreme Court",
-            "New York Court of Appeals", "Texas Supreme Court", "Florida Supreme Court"
-        ]
+        rng = random.Random(self.seed)
+        last_names = _fake_pool('last_name', seed=self.seed)
+        holdings = _fake_pool('paragraph', seed=self.seed, nb_sentences=3)
+        key_facts = _fake_pool('paragraph', seed=self.seed, nb_sentences=4)
+        reasonings = _fake_pool('paragraph', seed=self.seed, nb_sentences=5)
+        summaries = _fake_pool('paragraph', seed=self.seed, nb_sentences=2)
         
         for i in range(count):
             case_data = {
-                'case_name': f"{fake.last_name()} v. {fake.last_name()}",
-                'citation': f"{fake.random_int(100, 999)} F.{fake.random_int(2, 3)}d {fake.random_int(1, 1500)}",
-                'court': fake.random_element(courts_pool),
-                'jurisdiction': fake.random_element(['Federal', 'California', 'New York', 'Texas', 'Florida']),
-                'decision_date': fake.date_between(start_date='-50y', end_date='today'),
-                'legal_issues': fake.random_elements(legal_issues_pool, length=fake.random_int(1, 3)),
-                'holding': fake.paragraph(nb_sentences=3),
-                'key_facts': fake.paragraph(nb_sentences=4),
-                'legal_reasoning': fake.paragraph(nb_sentences=5),
-                'precedent_type': fake.random_element(['binding', 'persuasive']),
-                'practice_areas': fake.random_elements(
-                    ['Corporate Law', 'Litigation', 'Constitutional Law', 'Criminal Law', 'Civil Rights'],
-                    length=fake.random_int(1, 2)
-                ),
-                'summary': fake.paragraph(nb_sentences=2),
-                'citation_count': fake.random_int(0, 150),
-                'overruled': fake.boolean(chance_of_getting_true=5)
+                'case_law_id': f"case_{i+1:04d}",
+                'case_name': f"{rng.choice(last_names)} v. {rng.choice(last_names)}",
+                'citation': f"{rng.randint(100, 999)} F.{rng.randint(2, 3)}d {rng.randint(1, 1500)}",
+                'court': rng.choice(COURTS),
+                'jurisdiction': rng.choice(JURISDICTIONS),
+                'decision_date': _random_past_date(rng, 50),
+                'legal_issues': rng.sample(LEGAL_ISSUES, k=rng.randint(1, 3)),
+                'holding': rng.choice(holdings),
+                'key_facts': rng.choice(key_facts),
+                'legal_reasoning': rng.choice(reasonings),
+                'precedent_type': rng.choice(('binding', 'persuasive')),
+                'practice_areas': rng.sample(CASE_PRACTICE_AREAS, k=rng.randint(1, 2)),
+                'summary': rng.choice(summaries),
+                'citation_count': rng.randint(0, 150),
+                'overruled': rng.random() < 0.05
             }
             
-            if self.knowledge_store.add_case_law(case_data):
-                if (i + 1) % 20 == 0:
-                    logger.info(f"Added {i + 1} case law entries")
+            case_law.append(case_data)
+        
+        # Embed and store the whole set in one batch
+        added = self.knowledge_store.add_case_law_batch(case_law)
+        logger.info("Added %d of %d case law entries", added, count)
+        return case_law
     
-    def seed_statutes_knowledge(self, count: int = 50):
+    def seed_statutes_knowledge(self, count: int = 50) -> List[Dict[str, Any]]:
         """Seed ChromaDB with sample statutes"""
         logger.info("Seeding statutes knowledge...")
         
-        statute_titles = [
-            "Civil Rights Act", "Americans with Disabilities Act", "Securities Exchange Act",
-            "Fair Labor Standards Act", "Clean Air Act", "Sarbanes-Oxley Act",
-            "Employee Retirement Income Security Act", "Immigration and Nationality Act",
-            "Telecommunications Act", "Copyright Act", "Patent Act", "Trademark Act"
-        ]
+        statutes = []
+        
+        rng = random.Random(self.seed)
+        statute_texts = _fake_pool('paragraph', seed=self.seed, nb_sentences=8)
+        summaries = _fake_pool('paragraph', seed=self.seed, nb_sentences=3)
         
         for i in range(count):
-            title_base = fake.random_element(statute_titles)
             statute_data = {
-                'title': f"{title_base} of {fake.random_int(1950, 2023)}",
-                'citation': f"{fake.random_int(10, 50)} U.S.C. § {fake.random_int(100, 9999)}",
-                'jurisdiction': fake.random_element(['Federal', 'California', 'New York', 'Texas']),
-                'chapter': str(fake.random_int(1, 50)),
-                'section': str(fake.random_int(100, 9999)),
-                'effective_date': fake.date_between(start_date='-30y', end_date='today'),
-                'statute_text': fake.paragraph(nb_sentences=8),
-                'summary': fake.paragraph(nb_sentences=3),
-                'keywords': fake.random_elements(
-                    ['regulation', 'compliance', 'enforcement', 'liability', 'procedure', 'rights'],
-                    length=fake.random_int(2, 4)
-                ),
-                'practice_areas': fake.random_elements(
-                    ['Corporate Law', 'Employment Law', 'Environmental Law', 'Securities Law'],
-                    length=fake.random_int(1, 2)
-                )
+                'statute_id': f"statute_{i+1:04d}",
+                'title': f"{rng.choice(STATUTE_TITLES)} of {rng.randint(1950, 2023)}",
+                'citation': f"{rng.randint(10, 50)} U.S.C. § {rng.randint(100, 9999)}",
+                'jurisdiction': rng.choice(KNOWLEDGE_JURISDICTIONS),
+                'chapter': str(rng.randint(1, 50)),
+                'section': str(rng.randint(100, 9999)),
+                'effective_date': _random_past_date(rng, 30),
+                'statute_text': rng.choice(statute_texts),
+                'summary': rng.choice(summaries),
+                'keywords': rng.sample(STATUTE_KEYWORDS, k=rng.randint(2, 4)),
+                'practice_areas': rng.sample(STATUTE_PRACTICE_AREAS, k=rng.randint(1, 2))
             }
             
-            if self.knowledge_store.add_statute(statute_data):
-                if (i + 1) % 10 == 0:
-                    logger.info(f"Added {i + 1} statute entries")
+            statutes.append(statute_data)
+        
+        # Embed and store the whole set in one batch
+        added = self.knowledge_store.add_statute_batch(statutes)
+        logger.info("Added %d of %d statute entries", added, count)
+        return statutes
     
-    def seed_precedents_knowledge(self, count: int = 75):
+    def seed_precedents_knowledge(self, count: int = 75) -> List[Dict[str, Any]]:
         """Seed ChromaDB with sample legal precedents"""
         logger.info("Seeding legal precedents knowledge...")
         
-        legal_principles = [
-            "Duty of care in negligence", "Reasonable expectation of privacy", "Freedom of speech protection",
-            "Due process requirements", "Equal protection under law", "Commerce Clause authority",
-            "Executive privilege limitations", "Judicial review scope", "Contract formation requirements",
-            "Good faith and fair dealing", "Fiduciary duty standards", "Corporate veil piercing"
-        ]
+        precedents = []
+        
+        rng = random.Random(self.seed)
+        fact_patterns = _fake_pool('paragraph', seed=self.seed, nb_sentences=3)
+        legal_standards = _fake_pool('paragraph', seed=self.seed, nb_sentences=2)
         
         for i in range(count):
             precedent_data = {
-                'legal_principle': fake.random_element(legal_principles),
-                'precedent_weight': fake.random_int(5, 10),
-                'binding_authority': fake.random_element(['Supreme Court', 'Circuit Court', 'State Supreme Court']),
-                'jurisdiction': fake.random_element(['Federal', 'California', 'New York', 'Texas']),
-                'practice_area': fake.random_element(['Constitutional Law', 'Corporate Law', 'Civil Rights', 'Criminal Law']),
-                'fact_pattern': fake.paragraph(nb_sentences=3),
-                'legal_standard': fake.paragraph(nb_sentences=2),
-                'overruled': fake.boolean(chance_of_getting_true=3)
+                'precedent_id': f"precedent_{i+1:04d}",
+                'legal_principle': rng.choice(LEGAL_PRINCIPLES),
+                'precedent_weight': rng.randint(5, 10),
+                'binding_authority': rng.choice(('Supreme Court', 'Circuit Court', 'State Supreme Court')),
+                'jurisdiction': rng.choice(KNOWLEDGE_JURISDICTIONS),
+                'practice_area': rng.choice(PRECEDENT_PRACTICE_AREAS),
+                'fact_pattern': rng.choice(fact_patterns),
+                'legal_standard': rng.choice(legal_standards),
+                'overruled': rng.random() < 0.03
             }
             
-            if self.knowledge_store.add_precedent(precedent_data):
-                if (i + 1) % 15 == 0:
-                    logger.info(f"Added {i + 1} precedent entries")
+            precedents.append(precedent_data)
+        
+        # Embed and store the whole set in one batch
+        added = self.knowledge_store.add_precedent_batch(precedents)
+        logger.info("Added %d of %d precedent entries", added, count)
+        return precedents
     
     def seed_contract_templates(self, count: int = 25):
         """Seed ChromaDB with sample contract templates"""
         logger.info("Seeding contract templates...")
         
-        contract_types = [
-            'Employment Agreement', 'Non-Disclosure Agreement', 'Service Agreement',
-            'Purchase Agreement', 'Lease Agreement', 'Partnership Agreement',
-            'License Agreement', 'Merger Agreement', 'Loan Agreement'
-        ]
+        templates = []
+        
+        rng = random.Random(self.seed)
+        template_contents = _fake_pool('paragraph', seed=self.seed, nb_sentences=10)
         
         for i in range(count):
-            contract_type = fake.random_element(contract_types)
+            contract_type = rng.choice(CONTRACT_TYPES)
             template_data = {
                 'template_name': f"Standard {contract_type}",
                 'contract_type': contract_type.lower().replace(' ', '_'),
-                'jurisdiction': fake.random_element(['Federal', 'California', 'New York', 'Delaware']),
-                'practice_area': fake.random_element(['Corporate Law', 'Employment Law', 'Real Estate']),
-                'template_content': fake.paragraph(nb_sentences=10),
-                'standard_clauses': fake.random_elements(
-                    ['Termination', 'Confidentiality', 'Governing Law', 'Dispute Resolution', 'Force Majeure'],
-                    length=fake.random_int(3, 5)
-                ),
-                'optional_clauses': fake.random_elements(
-                    ['Non-Compete', 'Indemnification', 'Assignment', 'Amendment'],
-                    length=fake.random_int(1, 3)
-                ),
-                'risk_level': fake.random_element(['low', 'medium', 'high']),
-                'complexity_level': fake.random_element(['simple', 'medium', 'complex'])
+                'jurisdiction': rng.choice(CONTRACT_JURISDICTIONS),
+                'practice_area': rng.choice(('Corporate Law', 'Employment Law', 'Real Estate')),
+                'template_content': rng.choice(template_contents),
+                'standard_clauses': rng.sample(STANDARD_CLAUSES, k=rng.randint(3, 5)),
+                'optional_clauses': rng.sample(OPTIONAL_CLAUSES, k=rng.randint(1, 3)),
+                'risk_level': rng.choice(('low', 'medium', 'high')),
+                'complexity_level': rng.choice(('simple', 'medium', 'complex'))
             }
             
-            if self.knowledge_store.add_contract_template(template_data):
-                if (i + 1) % 5 == 0:
-                    logger.info(f"Added {i + 1} contract templates")
+            templates.append(template_data)
+        
+        # Embed and store the whole set in one batch
+        added = self.knowledge_store.add_contract_template_batch(templates)
+        logger.info("Added %d of %d contract templates", added, count)
     
-    def create_sample_interactions(self, attorney_ids: List[str], client_ids: List[str], count: int = 50):
-        """Create sample AI interactions for testing"""
+    def create_sample_interactions(self, relationships: List[Tuple[str, str]], count: int = 50):
+        """Create sample AI interactions for testing between related attorneys and clients"""
         logger.info("Creating sample AI interactions...")
+        created = 0
+        
+        if not relationships:
+            logger.info("No attorney-client relationships to create AI interactions for")
+            return
         
-        agent_types = ['legal_research', 'case_analysis', 'document_review', 'precedent_mining']
+        rng = random.Random(self.seed)
+        queries = _fake_pool('sentence', seed=self.seed, nb_words=10)
+        results = _fake_pool('paragraph', seed=self.seed, nb_sentences=3)
+        session_ids = uuid4_batch(count)
         
         for i in range(count):
-            attorney_id = fake.random_element(attorney_ids)
-            client_id = fake.random_element(client_ids)
-            agent_type = fake.random_element(agent_types)
+            attorney_id, client_id = rng.choice(relationships)
+            agent_type = rng.choice(AGENT_TYPES)
             
             interaction_data = {
                 'agent_type': agent_type,
                 'interaction_type': f'{agent_type}_query',
-                'query': fake.sentence(nb_words=10),
-                'response': {'result': fake.paragraph(nb_sentences=3), 'confidence': fake.pyfloat(min_value=0.7, max_value=0.99)},
-                'confidence_score': fake.pyfloat(min_value=0.7, max_value=0.99),
-                'processing_time_seconds': fake.pyfloat(min_value=0.5, max_value=5.0),
+                'query': rng.choice(queries),
+                'response': {'result': rng.choice(results), 'confidence': round(rng.uniform(0.7, 0.99), 2)},
+                'confidence_score': round(rng.uniform(0.7, 0.99), 2),
+                'processing_time_seconds': round(rng.uniform(0.5, 5.0), 2),
                 'privilege_protected': True,
-                'session_id': str(uuid.uuid4())
+                'session_id': session_ids[i]
             }
             
             try:
                 self.legal_db.store_ai_interaction(attorney_id, client_id, interaction_data)
-                if (i + 1) % 10 == 0:
-                    logger.info(f"Created {i + 1} AI interactions")
+                created += 1
             except Exception as e:
-                logger.debug(f"Failed to create interaction: {str(e)}")
+                logger.debug("Failed to create interaction: %s", e)
+        
+        logger.info("Created %d of %d AI interactions", created, count)
+    
+    def is_already_seeded(self) -> bool:
+        """Check whether a previous run already loaded the seed data"""
+        counts = self.legal_db.get_database_stats()
+        return all(counts.get(table, 0) >= SEED_COUNTS[table] for table in SEED_CHECK_TABLES)
     
     def run_full_seed(self):
-        """Run complete database seeding process"""
+        """
+        Run complete database seeding process
+        
+        Finishes with a TRUNCATE checkpoint so the WAL written during the load is
+        folded into the main database file - the equivalent of flushing a write
+        buffer after a large load, keeping later reads from searching two places.
+        """
+        if self.is_already_seeded():
+            logger.info("Database already holds the seed data; skipping seeding")
+            return
+        
         logger.info("Starting Legal AI Pod database seeding...")
         
         try:
-            # Seed attorneys and clients first
-            attorney_ids = self.seed_attorneys(15)
-            client_ids = self.seed_clients(30)
-            
-            # Create relationships
-            self.seed_attorney_client_relationships(attorney_ids, client_ids, 25)
-            
-            # Seed knowledge base
-            self.seed_case_law_knowledge(100)
-            self.seed_statutes_knowledge(50)
-            self.seed_precedents_knowledge(75)
-            self.seed_contract_templates(25)
+            # Every phase inserts rows, so secondary indexes are dropped up front and
+            # rebuilt in one pass once all seed data is in place
+            with self.legal_db.deferred_indexes():
+                # Seed attorneys, clients and their relationships under one write transaction
+                with self.legal_db.transaction():
+                    attorney_ids = self.seed_attorneys(SEED_COUNTS['attorneys'])
+                    client_ids = self.seed_clients(SEED_COUNTS['clients'])
+                    relationships = self.seed_attorney_client_relationships(
+                        attorney_ids, client_ids, SEED_COUNTS['attorney_client_relationships']
+                    )
+                
+                # The knowledge phases (including the curated reference asset) only touch
+                # ChromaDB, so generate and embed them concurrently; SQLite writes stay on
+                # this thread, which holds the lock. The store is loaded here first so the
+                # workers share one embedder instead of racing to load it, and the Faker
+                # pools are built here so thread scheduling cannot change their contents
+                self.knowledge_store
+                for provider, kwargs in _KNOWLEDGE_FAKE_POOLS:
+                    _fake_pool(provider, seed=self.seed, **kwargs)
+                with ThreadPoolExecutor(max_workers=5) as executor:
+                    reference_future = executor.submit(self.load_reference_knowledge)
+                    case_law_future = executor.submit(self.seed_case_law_knowledge, SEED_COUNTS['case_law'])
+                    statutes_future = executor.submit(self.seed_statutes_knowledge, SEED_COUNTS['statutes'])
+                    precedents_future = executor.submit(self.seed_precedents_knowledge, SEED_COUNTS['legal_precedents'])
+                    templates_future = executor.submit(self.seed_contract_templates, SEED_COUNTS['contract_templates'])
+                
+                reference = reference_future.result()
+                case_law = case_law_future.result()
+                statutes = statutes_future.result()
+                precedents = precedents_future.result()
+                templates_future.result()
+                
+                # Mirror reference knowledge into the SQLite search tables
+                self.legal_db.parallel_insert_tables({
+                    'case_law': reference['case_law'] + case_law,
+                    'statutes': reference['statutes'] + statutes,
+                    'legal_precedents': reference['legal_precedents'] + precedents
+                }, batch_size=BULK_BATCH_SIZE)
+                
+                # Create sample interactions (and their audit entries) under one write transaction
+                with self.legal_db.transaction():
+                    self.create_sample_interactions(relationships, SEED_COUNTS['ai_interactions'])
             
-            # Create sample interactions
-            self.create_sample_interactions(attorney_ids, client_ids, 50)
+            # Refresh planner statistics for the rebuilt indexes, then fold the WAL
+            # back into the main database after the bulk load
+            self.legal_db.conn.execute("ANALYZE")
+            self.legal_db.conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
             
             logger.info("Legal AI Pod database seeding completed successfully!")
             
@@ -339,13 +565,38 @@ class LegalDatabaseSeeder:
 
 def main():
     """Main execution function"""
+    parser = argparse.ArgumentParser(description="Seed the Legal AI Pod databases with sample data")
+    parser.add_argument('--db-path', default="./legal_data.db", help="SQLite database to seed")
+    parser.add_argument('--force-reset', action='store_true',
+                        help="Delete and rebuild the SQLite database if its schema is out of date")
+    parser.add_argument('--fast', action='store_true',
+                        help="Skip journaling and fsync for a faster, non-durable development seed")
+    parser.add_argument('--seed', type=int, help="Random seed for reproducible knowledge, relationship and interaction data")
+    args = parser.parse_args()
+    
     print("Legal AI Pod Database Setup")
     print("===========================")
     
+    # Verify the existing schema with read-only PRAGMA queries before seeding
+    schema_mismatches = LegalDataManager.find_schema_mismatches(args.db_path)
+    if schema_mismatches:
+        if not args.force_reset:
+            logger.error(f"Database schema is out of date (missing columns: {schema_mismatches})")
+            print("\nRe-run with --force-reset to delete and rebuild the database.")
+            sys.exit(1)
+        
+        logger.warning(f"Rebuilding database with outdated schema: {args.db_path}")
+        for path in (args.db_path, args.db_path + '-wal', args.db_path + '-shm'):
+            if os.path.exists(path):
+                os.remove(path)
+    
     # Create seeder and run
-    seeder = LegalDatabaseSeeder()
+    seeder = LegalDatabaseSeeder(args.db_path, fast=args.fast, seed=args.seed)
     seeder.run_full_seed()
     
+    # Release the session's exclusive lock so the app can open the database
+    seeder.legal_db.close()
+    
     print("\nSetup completed successfully!")
     print("You can now run the Legal AI Pod application with sample data.")
 
@@ -6,13 +6,32 @@ Handles professional responsibility compliance, ethical guidelines, and regulato
 
 import logging
 import json
+import bisect
+import statistics
+import time
+import orjson
 from datetime import datetime, timedelta
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Iterable, List, Optional
 import uuid
-from enum import Enum
+from collections import Counter, OrderedDict, defaultdict, deque
+from dataclasses import dataclass
+from enum import Enum, IntEnum
+from functools import lru_cache
+from types import MappingProxyType, SimpleNamespace
 
 logger = logging.getLogger(__name__)
 
+# Number of buffered compliance events written to the log at once
+COMPLIANCE_LOG_BATCH_SIZE = 50
+
+# Most compliance events kept in memory, and how long per-attorney history is retained
+COMPLIANCE_LOG_MAX_EVENTS = 200_000
+COMPLIANCE_LOG_RETENTION_DAYS = 365
+
+# Seconds a dashboard payload is reused while no new events arrive, and how many are kept
+DASHBOARD_CACHE_TTL = 5.0
+DASHBOARD_CACHE_SIZE = 128
+
 class EthicsRuleCategory(Enum):
     """Categories of legal ethics rules"""
     COMPETENCE = "competence"
@@ -34,112 +53,130 @@ class ComplianceStatus(Enum):
     REVIEW_REQUIRED = "review_required"
     REMEDIATION_NEEDED = "remediation_needed"
 
-class LegalEthicsComplianceManager:
-    """
-    Manages legal ethics compliance for AI systems
-    Ensures adherence to professional responsibility rules and regulatory requirements
-    """
+@dataclass
+class ComplianceEvent:
+    """Ethics compliance event recorded in the compliance log"""
+    __slots__ = ('log_id', 'timestamp', 'attorney_id', 'client_id', 'rule_category',
+                 'event_type', 'compliance_status', 'details', 'is_ai_related', 'metadata')
     
-    def __init__(self):
-        """Initialize legal ethics compliance system"""
-        self.ethics_rules = self._load_ethics_rules()
-        self.compliance_log = []
-        self.violation_tracking = {}
-        self.attorney_competence_records = {}
-        self.ai_disclosure_requirements = self._initialize_ai_disclosure_requirements()
-        
-        # Compliance thresholds
-        self.compliance_thresholds = {
-            'technology_competence_score': 7.0,
-            'ai_disclosure_compliance': 90.0,
-            'privilege_protection_score': 95.0,
-            'conflict_screening_accuracy': 98.0,
-            'client_communication_timeliness': 85.0
+    log_id: str
+    timestamp: datetime
+    attorney_id: Optional[str]
+    client_id: Optional[str]
+    rule_category: str
+    event_type: str
+    compliance_status: str
+    details: str
+    is_ai_related: bool
+    metadata: Dict[str, Any]
+
+# Weighted score at which each compliance level above 'poor' begins
+_LEVEL_THRESHOLDS = (50, 75, 90)
+_LEVEL_LABELS = ('poor', 'needs_improvement', 'good', 'excellent')
+
+# Rule category values, in declaration order, for per-category report loops
+_CATEGORY_VALUES = tuple(category.value for category in EthicsRuleCategory)
+
+# Status values compared in the log aggregation paths
+_COMPLIANT = ComplianceStatus.COMPLIANT.value
+_WARNING = ComplianceStatus.WARNING.value
+_VIOLATION = ComplianceStatus.VIOLATION.value
+_ISSUE_STATUSES = frozenset({_VIOLATION, _WARNING})
+
+class DisclosureTrigger(IntEnum):
+    """AI usage triggers that require disclosure to the client"""
+    SUBSTANTIVE = 0
+    STRATEGY = 1
+    DOC_REVIEW = 2
+    RESEARCH = 3
+    CLIENT_INQUIRY = 4
+
+# Scope every conflict of interest screening must cover
+_REQUIRED_SCREENING_SCOPE = frozenset({
+    'current_clients', 'former_clients', 'third_party_interests', 'business_relationships'
+})
+
+# Disclosure triggers with the ai_usage_data flag and requirement text for each
+_DISCLOSURE_TRIGGERS = (
+    (DisclosureTrigger.SUBSTANTIVE, 'substantive_work_generated', "AI generates substantive legal work product"),
+    (DisclosureTrigger.STRATEGY, 'strategy_influence', "AI influences significant case strategy decisions"),
+    (DisclosureTrigger.DOC_REVIEW, 'document_review', "AI reviews confidential client documents"),
+    (DisclosureTrigger.RESEARCH, 'critical_research', "AI assists with legal research for critical issues"),
+    (DisclosureTrigger.CLIENT_INQUIRY, 'client_inquiry_about_ai', "Client specifically asks about technology use")
+)
+_TRIGGER_KEYS = tuple(usage_key for _, usage_key, _ in _DISCLOSURE_TRIGGERS)
+_TRIGGER_REQUIREMENTS = tuple(requirement for _, _, requirement in _DISCLOSURE_TRIGGERS)
+
+# Professional responsibility rules, shared by every compliance manager
+_ETHICS_RULES = MappingProxyType({
+    EthicsRuleCategory.COMPETENCE.value: {
+        "rule_1_1": {
+            "title": "Competent Representation",
+            "description": "Lawyer shall provide competent representation requiring legal knowledge, skill, thoroughness, and preparation",
+            "ai_requirements": [
+                "Understand AI system capabilities and limitations",
+                "Maintain competence in legal technology use",
+                "Supervise AI-generated work appropriately"
+            ]
+        },
+        "rule_1_1_comment_8": {
+            "title": "Technology Competence",
+            "description": "Lawyer should keep abreast of changes in technology and their benefits/risks",
+            "ai_requirements": [
+                "Understand how AI systems work",
+                "Know when AI assistance is appropriate",
+                "Maintain human oversight of AI decisions"
+            ]
         }
-        
-        logger.info("Legal Ethics Compliance Manager initialized successfully")
-    
-    def _load_ethics_rules(self) -> Dict[str, Any]:
-        """Load professional responsibility and ethics rules"""
-        return {
-            EthicsRuleCategory.COMPETENCE.value: {
-                "rule_1_1": {
-                    "title": "Competent Representation",
-                    "description": "Lawyer shall provide competent representation requiring legal knowledge, skill, thoroughness, and preparation",
-                    "ai_requirements": [
-                        "Understand AI system capabilities and limitations",
-                        "Maintain competence in legal technology use",
-                        "Supervise AI-generated work appropriately"
-                    ]
-                },
-                "rule_1_1_comment_8": {
-                    "title": "Technology Competence",
-                    "description": "Lawyer should keep abreast of changes in technology and their benefits/risks",
-                    "ai_requirements": [
-                        "Understand how AI systems work",
-                        "Know when AI assistance is appropriate",
-                        "Maintain human oversight of AI decisions"
-                    ]
-                }
-            },
-            EthicsRuleCategory.CONFIDENTIALITY.value: {
-                "rule_1_6": {
-                    "title": "Confidentiality of Information",
-                    "description": "Lawyer shall not reveal information relating to client representation",
-                    "ai_requirements": [
-                        "Ensure AI systems protect client confidentiality",
-                        "Implement proper data security measures",
-                        "Control AI access to privileged information"
-                    ]
-                }
-            },
-            EthicsRuleCategory.CONFLICT_OF_INTEREST.value: {
-                "rule_1_7": {
-                    "title": "Conflict of Interest - Current Clients",
-                    "description": "Lawyer shall not represent client if representation involves concurrent conflict of interest",
-                    "ai_requirements": [
-                        "Use AI to screen for conflicts systematically",
-                        "Maintain comprehensive conflict databases",
-                        "Regular conflict checking procedures"
-                    ]
-                }
-            },
-            EthicsRuleCategory.CLIENT_RELATIONSHIP.value: {
-                "rule_1_4": {
-                    "title": "Communication",
-                    "description": "Lawyer shall reasonably consult with client about means of representation",
-                    "ai_requirements": [
-                        "Disclose AI use to clients when material",
-                        "Explain AI role in representation",
-                        "Maintain meaningful attorney-client communication"
-                    ]
-                }
-            },
-            EthicsRuleCategory.AI_DISCLOSURE.value: {
-                "ai_disclosure_rule": {
-                    "title": "AI Usage Disclosure",
-                    "description": "Attorney must disclose material use of AI in client representation",
-                    "ai_requirements": [
-                        "Disclose AI use when outcome-determinative",
-                        "Explain AI limitations and attorney oversight",
-                        "Document AI disclosure in client files"
-                    ]
-                }
-            }
+    },
+    EthicsRuleCategory.CONFIDENTIALITY.value: {
+        "rule_1_6": {
+            "title": "Confidentiality of Information",
+            "description": "Lawyer shall not reveal information relating to client representation",
+            "ai_requirements": [
+                "Ensure AI systems protect client confidentiality",
+                "Implement proper data security measures",
+                "Control AI access to privileged information"
+            ]
         }
-    
-    def _initialize_ai_disclosure_requirements(self) -> Dict[str, Any]:
-        """Initialize AI disclosure requirements and templates"""
-        return {
-            "disclosure_triggers": [
-                "AI generates substantive legal work product",
-                "AI influences significant case strategy decisions", 
-                "AI reviews confidential client documents",
-                "AI assists with legal research for critical issues",
-                "Client specifically asks about technology use"
-            ],
-            "disclosure_templates": {
-                "general_ai_disclosure": """
+    },
+    EthicsRuleCategory.CONFLICT_OF_INTEREST.value: {
+        "rule_1_7": {
+            "title": "Conflict of Interest - Current Clients",
+            "description": "Lawyer shall not represent client if representation involves concurrent conflict of interest",
+            "ai_requirements": [
+                "Use AI to screen for conflicts systematically",
+                "Maintain comprehensive conflict databases",
+                "Regular conflict checking procedures"
+            ]
+        }
+    },
+    EthicsRuleCategory.CLIENT_RELATIONSHIP.value: {
+        "rule_1_4": {
+            "title": "Communication",
+            "description": "Lawyer shall reasonably consult with client about means of representation",
+            "ai_requirements": [
+                "Disclose AI use to clients when material",
+                "Explain AI role in representation",
+                "Maintain meaningful attorney-client communication"
+            ]
+        }
+    },
+    EthicsRuleCategory.AI_DISCLOSURE.value: {
+        "ai_disclosure_rule": {
+            "title": "AI Usage Disclosure",
+            "description": "Attorney must disclose material use of AI in client representation",
+            "ai_requirements": [
+                "Disclose AI use when outcome-determinative",
+                "Explain AI limitations and attorney oversight",
+                "Document AI disclosure in client files"
+            ]
+        }
+    }
+})
+
+# Client disclosure templates for AI use
+GENERAL_AI_DISCLOSURE = """
 DISCLOSURE OF ARTIFICIAL INTELLIGENCE USE
 
 This firm uses artificial intelligence (AI) technology to assist with certain aspects of legal representation, including research, document review, and case analysis. Please be aware that:
@@ -152,28 +189,95 @@ This firm uses artificial intelligence (AI) technology to assist with certain as
 6. Human Oversight: Final legal decisions and strategy remain under attorney control
 
 If you have questions about our use of AI technology, please contact us.
-""",
-                "document_review_disclosure": """
+"""
+
+DOCUMENT_REVIEW_DISCLOSURE = """
 AI DOCUMENT REVIEW DISCLOSURE
 
 We use AI technology to assist with document review in your matter. The AI system helps identify relevant documents and key information, but all conclusions and legal analysis are performed by our attorneys.
-""",
-                "legal_research_disclosure": """
+"""
+
+LEGAL_RESEARCH_DISCLOSURE = """
 AI LEGAL RESEARCH DISCLOSURE
 
 Our legal research for your matter includes AI-assisted case law and statute searches. All research results are verified by our attorneys before being relied upon in your representation.
 """
-            }
-        }
+
+_DISCLOSURE_TEMPLATES = MappingProxyType({
+    "general_ai_disclosure": GENERAL_AI_DISCLOSURE,
+    "document_review_disclosure": DOCUMENT_REVIEW_DISCLOSURE,
+    "legal_research_disclosure": LEGAL_RESEARCH_DISCLOSURE
+})
+
+# AI disclosure triggers and client disclosure templates
+_AI_DISCLOSURE_REQS = MappingProxyType({
+    "disclosure_triggers": list(_TRIGGER_REQUIREMENTS),
+    "disclosure_templates": _DISCLOSURE_TEMPLATES
+})
+
+@lru_cache(maxsize=1 << len(DisclosureTrigger))
+def _disclosure_template_for_mask(trigger_mask: int) -> str:
+    """Build the client disclosure for a bitmask of fired disclosure triggers"""
+    specific_disclosures = []
+    
+    if trigger_mask & (1 << DisclosureTrigger.DOC_REVIEW):
+        specific_disclosures.append(DOCUMENT_REVIEW_DISCLOSURE)
+    
+    if trigger_mask & (1 << DisclosureTrigger.RESEARCH):
+        specific_disclosures.append(LEGAL_RESEARCH_DISCLOSURE)
+    
+    if specific_disclosures:
+        return GENERAL_AI_DISCLOSURE + "\n\nSPECIFIC AI USE IN YOUR MATTER:\n" + "\n".join(specific_disclosures)
+    else:
+        return GENERAL_AI_DISCLOSURE
+
+class LegalEthicsComplianceManager:
+    """
+    Manages legal ethics compliance for AI systems
+    Ensures adherence to professional responsibility rules and regulatory requirements
+    """
+    
+    __slots__ = ('ethics_rules', 'compliance_log', '_logs_by_attorney', '_pending', 'max_batch',
+                 'retention_days', 'violation_tracking', 'attorney_competence_records',
+                 'ai_disclosure_requirements', 'compliance_thresholds', '_log_version',
+                 '_dashboard_cache')
+    
+    def __init__(self, max_batch: int = COMPLIANCE_LOG_BATCH_SIZE,
+                 max_events: int = COMPLIANCE_LOG_MAX_EVENTS,
+                 retention_days: int = COMPLIANCE_LOG_RETENTION_DAYS):
+        """Initialize legal ethics compliance system"""
+        self.ethics_rules = _ETHICS_RULES
+        self.compliance_log = deque(maxlen=max_events)
+        self._logs_by_attorney = defaultdict(deque)
+        self._pending = deque()
+        self.max_batch = max_batch
+        self.retention_days = retention_days
+        self.violation_tracking = defaultdict(deque)
+        self.attorney_competence_records = {}
+        self.ai_disclosure_requirements = _AI_DISCLOSURE_REQS
+        self._log_version = 0
+        self._dashboard_cache = OrderedDict()
+        
+        # Compliance thresholds
+        self.compliance_thresholds = SimpleNamespace(
+            technology_competence_score=7.0,
+            ai_disclosure_compliance=90.0,
+            privilege_protection_score=95.0,
+            conflict_screening_accuracy=98.0,
+            client_communication_timeliness=85.0
+        )
+        
+        logger.info("Legal Ethics Compliance Manager initialized successfully")
     
     def assess_technology_competence(self, attorney_id: str, 
                                    competence_data: Dict[str, Any]) -> Dict[str, Any]:
         """Assess attorney's technology competence under Rule 1.1"""
         try:
+            checked_at = datetime.now()
             competence_assessment = {
                 'assessment_id': str(uuid.uuid4()),
                 'attorney_id': attorney_id,
-                'assessment_date': datetime.now().isoformat(),
+                'assessment_date': checked_at.isoformat(),
                 'competence_areas': {},
                 'overall_score': 0.0,
                 'compliance_status': ComplianceStatus.COMPLIANT.value,
@@ -190,16 +294,17 @@ Our legal research for your matter includes AI-assisted case law and statute sea
             }
             
             # Calculate scores and identify issues
+            competence_threshold = self.compliance_thresholds.technology_competence_score
             total_score = 0
             for area, score in competence_areas.items():
                 competence_assessment['competence_areas'][area] = {
                     'score': score,
-                    'threshold': self.compliance_thresholds['technology_competence_score'],
-                    'compliant': score >= self.compliance_thresholds['technology_competence_score']
+                    'threshold': competence_threshold,
+                    'compliant': score >= competence_threshold
                 }
                 total_score += score
                 
-                if score < self.compliance_thresholds['technology_competence_score']:
+                if score < competence_threshold:
                     competence_assessment['recommendations'].append(
                         f"Improve competence in {area.replace('_', ' ')}"
                     )
@@ -221,6 +326,7 @@ Our legal research for your matter includes AI-assisted case law and statute sea
                 rule_category=EthicsRuleCategory.COMPETENCE.value,
                 event_type='competence_assessment',
                 compliance_status=competence_assessment['compliance_status'],
+                timestamp=checked_at,
                 details=f"Technology competence assessed: {competence_assessment['overall_score']:.1f}/10"
             )
             
@@ -234,11 +340,12 @@ Our legal research for your matter includes AI-assisted case law and statute sea
                                      ai_usage_data: Dict[str, Any]) -> Dict[str, Any]:
         """Check compliance with AI disclosure requirements"""
         try:
+            checked_at = datetime.now()
             disclosure_check = {
                 'check_id': str(uuid.uuid4()),
                 'attorney_id': attorney_id,
                 'client_id': client_id,
-                'check_date': datetime.now().isoformat(),
+                'check_date': checked_at.isoformat(),
                 'ai_usage_summary': ai_usage_data,
                 'disclosure_required': False,
                 'disclosure_provided': False,
@@ -247,12 +354,8 @@ Our legal research for your matter includes AI-assisted case law and statute sea
             }
             
             # Check if disclosure is required
-            disclosure_triggers = self.ai_disclosure_requirements['disclosure_triggers']
-            triggered_requirements = []
-            
-            for trigger in disclosure_triggers:
-                if self._check_disclosure_trigger(trigger, ai_usage_data):
-                    triggered_requirements.append(trigger)
+            fired_triggers = self._triggers_fired(ai_usage_data)
+            triggered_requirements = [_TRIGGER_REQUIREMENTS[trigger] for trigger in fired_triggers]
             
             disclosure_check['triggered_requirements'] = triggered_requirements
             disclosure_check['disclosure_required'] = len(triggered_requirements) > 0
@@ -270,7 +373,7 @@ Our legal research for your matter includes AI-assisted case law and statute sea
             # Generate disclosure template if needed
             if disclosure_check['disclosure_required'] and not disclosure_check['disclosure_provided']:
                 disclosure_check['suggested_disclosure'] = self._generate_disclosure_template(
-                    triggered_requirements, ai_usage_data
+                    fired_triggers, ai_usage_data
                 )
             
             # Log compliance check
@@ -280,6 +383,7 @@ Our legal research for your matter includes AI-assisted case law and statute sea
                 rule_category=EthicsRuleCategory.AI_DISCLOSURE.value,
                 event_type='ai_disclosure_check',
                 compliance_status=disclosure_check['compliance_status'],
+                timestamp=checked_at,
                 details=f"AI disclosure check: {len(triggered_requirements)} triggers, disclosure {'provided' if disclosure_check['disclosure_provided'] else 'not provided'}"
             )
             
@@ -293,11 +397,12 @@ Our legal research for your matter includes AI-assisted case law and statute sea
                                               communication_data: Dict[str, Any]) -> Dict[str, Any]:
         """Monitor compliance with client communication requirements"""
         try:
+            checked_at = datetime.now()
             communication_check = {
                 'check_id': str(uuid.uuid4()),
                 'attorney_id': attorney_id,
                 'client_id': client_id,
-                'check_date': datetime.now().isoformat(),
+                'check_date': checked_at.isoformat(),
                 'communication_analysis': {},
                 'compliance_status': ComplianceStatus.COMPLIANT.value,
                 'issues_identified': [],
@@ -307,8 +412,12 @@ Our legal research for your matter includes AI-assisted case law and statute sea
             # Analyze communication timeliness
             response_times = communication_data.get('response_times', [])
             if response_times:
-                avg_response_time = sum(response_times) / len(response_times)
+                avg_response_time = statistics.fmean(response_times)
                 communication_check['communication_analysis']['average_response_hours'] = avg_response_time
+                if len(response_times) > 1:
+                    communication_check['communication_analysis']['p95_response_hours'] = statistics.quantiles(
+                        response_times, n=20, method='inclusive'
+                    )[-1]
                 
                 if avg_response_time > 48:  # More than 2 days
                     communication_check['issues_identified'].append('Slow response times')
@@ -337,6 +446,7 @@ Our legal research for your matter includes AI-assisted case law and statute sea
                 rule_category=EthicsRuleCategory.COMMUNICATION.value,
                 event_type='communication_compliance_check',
                 compliance_status=communication_check['compliance_status'],
+                timestamp=checked_at,
                 details=f"Communication compliance: {len(communication_check['issues_identified'])} issues identified"
             )
             
@@ -350,10 +460,11 @@ Our legal research for your matter includes AI-assisted case law and statute sea
                                              screening_data: Dict[str, Any]) -> Dict[str, Any]:
         """Validate conflict of interest screening procedures"""
         try:
+            checked_at = datetime.now()
             screening_validation = {
                 'validation_id': str(uuid.uuid4()),
                 'attorney_id': attorney_id,
-                'validation_date': datetime.now().isoformat(),
+                'validation_date': checked_at.isoformat(),
                 'screening_analysis': {},
                 'compliance_status': ComplianceStatus.COMPLIANT.value,
                 'procedural_issues': [],
@@ -368,8 +479,7 @@ Our legal research for your matter includes AI-assisted case law and statute sea
             
             # Check screening comprehensiveness
             screening_scope = screening_data.get('screening_scope', [])
-            required_scope = ['current_clients', 'former_clients', 'third_party_interests', 'business_relationships']
-            missing_scope = [item for item in required_scope if item not in screening_scope]
+            missing_scope = sorted(_REQUIRED_SCREENING_SCOPE.difference(screening_scope))
             
             if missing_scope:
                 screening_validation['procedural_issues'].append(f'Incomplete screening scope: missing {missing_scope}')
@@ -397,6 +507,7 @@ Our legal research for your matter includes AI-assisted case law and statute sea
                 rule_category=EthicsRuleCategory.CONFLICT_OF_INTEREST.value,
                 event_type='conflict_screening_validation',
                 compliance_status=screening_validation['compliance_status'],
+                timestamp=checked_at,
                 details=f"Conflict screening validation: {len(screening_validation['procedural_issues'])} issues found"
             )
             
@@ -410,11 +521,12 @@ Our legal research for your matter includes AI-assisted case law and statute sea
                                           billing_data: Dict[str, Any]) -> Dict[str, Any]:
         """Assess compliance with fee and billing ethics rules"""
         try:
+            checked_at = datetime.now()
             billing_assessment = {
                 'assessment_id': str(uuid.uuid4()),
                 'attorney_id': attorney_id,
                 'client_id': client_id,
-                'assessment_date': datetime.now().isoformat(),
+                'assessment_date': checked_at.isoformat(),
                 'billing_analysis': {},
                 'compliance_status': ComplianceStatus.COMPLIANT.value,
                 'billing_issues': [],
@@ -455,6 +567,7 @@ Our legal research for your matter includes AI-assisted case law and statute sea
                 rule_category=EthicsRuleCategory.FEES_AND_BILLING.value,
                 event_type='billing_compliance_assessment',
                 compliance_status=billing_assessment['compliance_status'],
+                timestamp=checked_at,
                 details=f"Billing assessment: {len(billing_assessment['billing_issues'])} issues identified"
             )
             
@@ -468,32 +581,32 @@ Our legal research for your matter includes AI-assisted case law and statute sea
                                                reporting_period_days: int = 30) -> Dict[str, Any]:
         """Generate comprehensive ethics compliance report"""
         try:
+            self.flush()
             end_date = datetime.now()
             start_date = end_date - timedelta(days=reporting_period_days)
             
-            # Filter compliance logs for the reporting period
-            relevant_logs = [
-                log for log in self.compliance_log
-                if (log.get('attorney_id') == attorney_id and
-                    start_date <= datetime.fromisoformat(log['timestamp']) <= end_date)
-            ]
+            # Aggregate the reporting period's logs in a single streaming pass
+            summary = self._summarize_logs(self._stream_logs(attorney_id, start_date, end_date))
             
             # Analyze compliance by category
             compliance_by_category = {}
-            for category in EthicsRuleCategory:
-                category_logs = [log for log in relevant_logs if log['rule_category'] == category.value]
-                compliance_by_category[category.value] = {
-                    'total_events': len(category_logs),
-                    'violations': len([log for log in category_logs if log['compliance_status'] == ComplianceStatus.VIOLATION.value]),
-                    'warnings': len([log for log in category_logs if log['compliance_status'] == ComplianceStatus.WARNING.value]),
-                    'compliance_rate': self._calculate_category_compliance_rate(category_logs)
+            for category_value in _CATEGORY_VALUES:
+                category_counts = summary['by_category'][category_value]
+                total_events = sum(category_counts.values())
+                compliance_by_category[category_value] = {
+                    'total_events': total_events,
+                    'violations': category_counts[_VIOLATION],
+                    'warnings': category_counts[_WARNING],
+                    'compliance_rate': self._calculate_category_compliance_rate(
+                        category_counts[_COMPLIANT], total_events
+                    )
                 }
             
             # Calculate overall compliance scores
-            overall_compliance = self._calculate_overall_compliance_score(relevant_logs)
+            overall_compliance = self._calculate_overall_compliance_score(summary['status_totals'])
             
             # Generate recommendations
-            recommendations = self._generate_compliance_recommendations(compliance_by_category, relevant_logs)
+            recommendations = self._generate_compliance_recommendations(compliance_by_category, summary)
             
             compliance_report = {
                 'report_id': str(uuid.uuid4()),
@@ -505,10 +618,10 @@ Our legal research for your matter includes AI-assisted case law and statute sea
                 },
                 'overall_compliance': overall_compliance,
                 'compliance_by_category': compliance_by_category,
-                'key_findings': self._extract_key_findings(relevant_logs),
+                'key_findings': self._extract_key_findings(summary),
                 'recommendations': recommendations,
                 'action_items': self._prioritize_action_items(compliance_by_category),
-                'generated_at': datetime.now().isoformat()
+                'generated_at': end_date.isoformat()
             }
             
             return compliance_report
@@ -517,55 +630,73 @@ Our legal research for your matter includes AI-assisted case law and statute sea
             logger.error(f"Failed to generate compliance report: {str(e)}")
             return {'error': f'Compliance report generation failed: {str(e)}'}
     
-    def _check_disclosure_trigger(self, trigger: str, ai_usage_data: Dict[str, Any]) -> bool:
+    def is_disclosure_required(self, ai_usage_data: Dict[str, Any]) -> bool:
+        """Check whether any AI usage requires disclosure to the client"""
+        return self._any_trigger_fires(ai_usage_data)
+    
+    def _any_trigger_fires(self, ai_usage_data: Dict[str, Any]) -> bool:
+        """Check if any disclosure trigger applies, stopping at the first hit"""
+        return any(ai_usage_data.get(usage_key, False) for usage_key in _TRIGGER_KEYS)
+    
+    def _triggers_fired(self, ai_usage_data: Dict[str, Any]) -> List[DisclosureTrigger]:
+        """List every disclosure trigger that applies"""
+        return [
+            trigger for trigger, usage_key, _ in _DISCLOSURE_TRIGGERS
+            if self._check_disclosure_trigger(usage_key, ai_usage_data)
+        ]
+    
+    def _check_disclosure_trigger(self, usage_key: str, ai_usage_data: Dict[str, Any]) -> bool:
         """Check if specific disclosure trigger applies"""
-        trigger_checks = {
-            "AI generates substantive legal work product": ai_usage_data.get('substantive_work_generated', False),
-            "AI influences significant case strategy decisions": ai_usage_data.get('strategy_influence', False),
-            "AI reviews confidential client documents": ai_usage_data.get('document_review', False),
-            "AI assists with legal research for critical issues": ai_usage_data.get('critical_research', False),
-            "Client specifically asks about technology use": ai_usage_data.get('client_inquiry_about_ai', False)
-        }
-        
-        return trigger_checks.get(trigger, False)
+        return bool(ai_usage_data.get(usage_key, False))
     
-    def _generate_disclosure_template(self, triggered_requirements: List[str],
+    def _generate_disclosure_template(self, fired_triggers: List[DisclosureTrigger],
                                     ai_usage_data: Dict[str, Any]) -> str:
         """Generate appropriate disclosure template based on AI usage"""
-        base_disclosure = self.ai_disclosure_requirements['disclosure_templates']['general_ai_disclosure']
-        
-        specific_disclosures = []
+        trigger_mask = 0
+        for trigger in fired_triggers:
+            trigger_mask |= 1 << trigger
         
-        if any('document' in req.lower() for req in triggered_requirements):
-            specific_disclosures.append(
-                self.ai_disclosure_requirements['disclosure_templates']['document_review_disclosure']
-            )
+        return _disclosure_template_for_mask(trigger_mask)
+    
+    def _summarize_logs(self, logs: Iterable[ComplianceEvent]) -> Dict[str, Any]:
+        """Aggregate the counts used by reports and dashboards in one pass over the logs"""
+        by_category = defaultdict(Counter)
+        status_totals = Counter()
+        issue_event_types = Counter()
+        issue_categories = Counter()
+        ai_count = 0
         
-        if any('research' in req.lower() for req in triggered_requirements):
-            specific_disclosures.append(
-                self.ai_disclosure_requirements['disclosure_templates']['legal_research_disclosure']
-            )
+        for log in logs:
+            status = log.compliance_status
+            category = log.rule_category
+            by_category[category][status] += 1
+            status_totals[status] += 1
+            if status in _ISSUE_STATUSES:
+                issue_event_types[log.event_type] += 1
+                issue_categories[category] += 1
+            if log.is_ai_related:
+                ai_count += 1
         
-        if specific_disclosures:
-            return base_disclosure + "\n\nSPECIFIC AI USE IN YOUR MATTER:\n" + "\n".join(specific_disclosures)
-        else:
-            return base_disclosure
+        return {
+            'by_category': by_category,
+            'status_totals': status_totals,
+            'issue_event_types': issue_event_types,
+            'issue_categories': issue_categories,
+            'ai_count': ai_count,
+            'total': sum(status_totals.values())
+        }
     
-    def _calculate_category_compliance_rate(self, category_logs: List[Dict[str, Any]]) -> float:
+    def _calculate_category_compliance_rate(self, compliant_events: int, total_events: int) -> float:
         """Calculate compliance rate for a specific category"""
-        if not category_logs:
+        if not total_events:
             return 100.0
         
-        compliant_events = len([
-            log for log in category_logs 
-            if log['compliance_status'] == ComplianceStatus.COMPLIANT.value
-        ])
-        
-        return (compliant_events / len(category_logs)) * 100
+        return (compliant_events / total_events) * 100
     
-    def _calculate_overall_compliance_score(self, logs: List[Dict[str, Any]]) -> Dict[str, Any]:
-        """Calculate overall compliance score"""
-        if not logs:
+    def _calculate_overall_compliance_score(self, status_totals: Counter) -> Dict[str, Any]:
+        """Calculate overall compliance score from event counts per compliance status"""
+        total_events = sum(status_totals.values())
+        if not total_events:
             return {
                 'overall_score': 100.0,
                 'compliance_level': 'excellent',
@@ -574,29 +705,26 @@ Our legal research for your matter includes AI-assisted case law and statute sea
                 'warnings': 0
             }
         
-        violations = len([log for log in logs if log['compliance_status'] == ComplianceStatus.VIOLATION.value])
-        warnings = len([log for log in logs if log['compliance_status'] == ComplianceStatus.WARNING.value])
-        compliant = len([log for log in logs if log['compliance_status'] == ComplianceStatus.COMPLIANT.value])
+        violations = status_totals[_VIOLATION]
+        warnings = status_totals[_WARNING]
+        compliant = status_totals[_COMPLIANT]
         
         # Weighted scoring: violations more serious than warnings
-        weighted_score = (compliant + (warnings * 0.5)) / len(logs) * 100
+        weighted_score = (compliant + (warnings * 0.5)) / total_events * 100
         
-        compliance_level = 'excellent' if weighted_score >= 90 else \
-                          'good' if weighted_score >= 75 else \
-                          'needs_improvement' if weighted_score >= 50 else \
-                          'poor'
+        compliance_level = _LEVEL_LABELS[bisect.bisect_right(_LEVEL_THRESHOLDS, weighted_score)]
         
         return {
             'overall_score': round(weighted_score, 2),
             'compliance_level': compliance_level,
-            'total_events': len(logs),
+            'total_events': total_events,
             'violations': violations,
             'warnings': warnings,
             'compliant': compliant
         }
     
     def _generate_compliance_recommendations(self, compliance_by_category: Dict[str, Any],
-                                           logs: List[Dict[str, Any]]) -> List[str]:
+                                           summary: Dict[str, Any]) -> List[str]:
         """Generate compliance improvement recommendations"""
         recommendations = []
         
@@ -607,36 +735,29 @@ Our legal research for your matter includes AI-assisted case law and statute sea
                 recommendations.append(f"Improve compliance in {category_name} (current rate: {stats['compliance_rate']:.1f}%)")
         
         # General recommendations
-        total_violations = sum([len([log for log in logs if log['compliance_status'] == ComplianceStatus.VIOLATION.value])])
+        total_violations = summary['status_totals'][_VIOLATION]
         if total_violations > 0:
             recommendations.append(f"Address {total_violations} compliance violations immediately")
         
         # Technology-specific recommendations
-        ai_logs = [log for log in logs if 'ai' in log.get('details', '').lower()]
-        if ai_logs:
+        if summary['ai_count']:
             recommendations.append("Review AI usage procedures and disclosure practices")
         
         return recommendations
     
-    def _extract_key_findings(self, logs: List[Dict[str, Any]]) -> List[str]:
-        """Extract key findings from compliance logs"""
+    def _extract_key_findings(self, summary: Dict[str, Any]) -> List[str]:
+        """Extract key findings from summarized compliance logs"""
         findings = []
         
         # Most common issues
-        violation_types = {}
-        for log in logs:
-            if log['compliance_status'] in [ComplianceStatus.VIOLATION.value, ComplianceStatus.WARNING.value]:
-                event_type = log.get('event_type', 'unknown')
-                violation_types[event_type] = violation_types.get(event_type, 0) + 1
-        
-        if violation_types:
-            most_common = max(violation_types.items(), key=lambda x: x[1])
+        issue_event_types = summary['issue_event_types']
+        if issue_event_types:
+            most_common = issue_event_types.most_common(1)[0]
             findings.append(f"Most common compliance issue: {most_common[0]} ({most_common[1]} occurrences)")
         
         # AI-related findings
-        ai_related_logs = [log for log in logs if 'ai' in log.get('details', '').lower()]
-        if ai_related_logs:
-            findings.append(f"AI-related compliance events: {len(ai_related_logs)}")
+        if summary['ai_count']:
+            findings.append(f"AI-related compliance events: {summary['ai_count']}")
         
         return findings
     
@@ -668,103 +789,162 @@ Our legal research for your matter includes AI-assisted case law and statute sea
     
     def _log_compliance_event(self, rule_category: str, event_type: str,
                             compliance_status: str, attorney_id: str = None,
-                            client_id: str = None, details: str = '', **kwargs):
+                            client_id: str = None, details: str = '',
+                            timestamp: Optional[datetime] = None, **kwargs):
         """Log ethics compliance event"""
-        log_entry = {
-            'log_id': str(uuid.uuid4()),
-            'timestamp': datetime.now().isoformat(),
-            'attorney_id': attorney_id,
-            'client_id': client_id,
-            'rule_category': rule_category,
-            'event_type': event_type,
-            'compliance_status': compliance_status,
-            'details': details,
-            'metadata': kwargs
-        }
-        
-        self.compliance_log.append(log_entry)
-        
-        # Track violations for escalation
-        if compliance_status == ComplianceStatus.VIOLATION.value:
-            if attorney_id not in self.violation_tracking:
-                self.violation_tracking[attorney_id] = []
-            self.violation_tracking[attorney_id].append(log_entry)
+        # Normalize optional fields once so the aggregation paths can read them directly
+        event_type = event_type or 'unknown'
+        details = details or ''
+        log_entry = ComplianceEvent(
+            log_id=str(uuid.uuid4()),
+            timestamp=timestamp or datetime.now(),
+            attorney_id=attorney_id,
+            client_id=client_id,
+            rule_category=rule_category,
+            event_type=event_type,
+            compliance_status=compliance_status,
+            details=details,
+            is_ai_related='ai' in details.lower(),
+            metadata=kwargs
+        )
+        
+        self._pending.append(log_entry)
+        if len(self._pending) >= self.max_batch:
+            self.flush()
         
         logger.info(f"Ethics compliance event logged: {event_type} - {compliance_status}")
     
+    def flush(self) -> int:
+        """Write buffered compliance events to the log and indexes"""
+        pending = self._pending
+        flushed = len(pending)
+        if not flushed:
+            return 0
+        
+        self.compliance_log.extend(pending)
+        touched_attorneys = set()
+        for log_entry in pending:
+            attorney_id = log_entry.attorney_id
+            self._logs_by_attorney[attorney_id].append(log_entry)
+            touched_attorneys.add(attorney_id)
+            
+            # Track violations for escalation
+            if log_entry.compliance_status == _VIOLATION:
+                self.violation_tracking[attorney_id].append(log_entry)
+        
+        # Drop per-attorney history that has aged out of the retention window
+        cutoff = datetime.now() - timedelta(days=self.retention_days)
+        for attorney_id in touched_attorneys:
+            for history in (self._logs_by_attorney[attorney_id], self.violation_tracking.get(attorney_id)):
+                while history and history[0].timestamp < cutoff:
+                    history.popleft()
+        
+        pending.clear()
+        self._log_version += 1
+        logger.debug("Flushed %d ethics compliance events", flushed)
+        return flushed
+    
+    def _stream_logs(self, attorney_id: str, start_date: datetime, end_date: datetime):
+        """Yield an attorney's logs within the period, newest first, without building a list"""
+        for log in reversed(self._logs_by_attorney.get(attorney_id, ())):
+            if log.timestamp < start_date:
+                break
+            if log.timestamp <= end_date:
+                yield log
+    
+    def _logs_since(self, logs, start_date: datetime) -> List[ComplianceEvent]:
+        """Return the logs at or after start_date, scanning back from the newest entry"""
+        recent_logs = []
+        for log in reversed(logs):
+            if log.timestamp < start_date:
+                break
+            recent_logs.append(log)
+        recent_logs.reverse()
+        return recent_logs
+    
+    def export_log(self) -> bytes:
+        """Export the compliance log as JSON"""
+        self.flush()
+        return orjson.dumps(list(self.compliance_log), default=str)
+    
     def get_compliance_dashboard_data(self, attorney_id: str = None) -> Dict[str, Any]:
         """Get compliance dashboard data"""
         try:
+            self.flush()
+            
+            # Reuse a recent payload if no events have been logged since
+            cache_key = attorney_id or None
+            cached = self._dashboard_cache.get(cache_key)
+            if (cached and cached[0] == self._log_version and
+                    time.monotonic() - cached[1] < DASHBOARD_CACHE_TTL):
+                self._dashboard_cache.move_to_end(cache_key)
+                return dict(cached[2])
+            
             # Filter logs by attorney if specified
             relevant_logs = self.compliance_log
             if attorney_id:
-                relevant_logs = [log for log in self.compliance_log if log.get('attorney_id') == attorney_id]
+                relevant_logs = self._logs_by_attorney.get(attorney_id, ())
             
             # Recent compliance trends (last 7 days)
-            recent_date = datetime.now() - timedelta(days=7)
-            recent_logs = [
-                log for log in relevant_logs
-                if datetime.fromisoformat(log['timestamp']) > recent_date
-            ]
+            now = datetime.now()
+            recent_date = now - timedelta(days=7)
+            recent_summary = self._summarize_logs(self._logs_since(relevant_logs, recent_date))
             
             dashboard_data = {
                 'overall_metrics': {
                     'total_compliance_events': len(relevant_logs),
-                    'recent_events': len(recent_logs),
-                    'active_violations': len([log for log in recent_logs if log['compliance_status'] == ComplianceStatus.VIOLATION.value]),
-                    'warnings_issued': len([log for log in recent_logs if log['compliance_status'] == ComplianceStatus.WARNING.value])
+                    'recent_events': recent_summary['total'],
+                    'active_violations': recent_summary['status_totals'][_VIOLATION],
+                    'warnings_issued': recent_summary['status_totals'][_WARNING]
                 },
-                'compliance_by_category': self._get_category_breakdown(recent_logs),
-                'trending_issues': self._identify_trending_issues(recent_logs),
+                'compliance_by_category': self._get_category_breakdown(recent_summary),
+                'trending_issues': self._identify_trending_issues(recent_summary),
                 'attorney_specific_data': self.attorney_competence_records.get(attorney_id, {}) if attorney_id else {},
-                'recommendations': self._get_dashboard_recommendations(recent_logs),
-                'last_updated': datetime.now().isoformat()
+                'recommendations': self._get_dashboard_recommendations(recent_summary),
+                'last_updated': now.isoformat()
             }
             
-            return dashboard_data
+            self._dashboard_cache[cache_key] = (self._log_version, time.monotonic(), dashboard_data)
+            self._dashboard_cache.move_to_end(cache_key)
+            if len(self._dashboard_cache) > DASHBOARD_CACHE_SIZE:
+                self._dashboard_cache.popitem(last=False)
+            
+            return dict(dashboard_data)
             
         except Exception as e:
             logger.error(f"Failed to get compliance dashboard data: {str(e)}")
             return {'error': f'Dashboard data retrieval failed: {str(e)}'}
     
-    def _get_category_breakdown(self, logs: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def _get_category_breakdown(self, summary: Dict[str, Any]) -> Dict[str, Any]:
         """Get compliance breakdown by category"""
         category_breakdown = {}
         
-        for category in EthicsRuleCategory:
-            category_logs = [log for log in logs if log['rule_category'] == category.value]
-            category_breakdown[category.value] = {
-                'total': len(category_logs),
-                'violations': len([log for log in category_logs if log['compliance_status'] == ComplianceStatus.VIOLATION.value]),
-                'warnings': len([log for log in category_logs if log['compliance_status'] == ComplianceStatus.WARNING.value]),
-                'compliant': len([log for log in category_logs if log['compliance_status'] == ComplianceStatus.COMPLIANT.value])
+        for category_value in _CATEGORY_VALUES:
+            category_counts = summary['by_category'][category_value]
+            category_breakdown[category_value] = {
+                'total': sum(category_counts.values()),
+                'violations': category_counts[_VIOLATION],
+                'warnings': category_counts[_WARNING],
+                'compliant': category_counts[_COMPLIANT]
             }
         
         return category_breakdown
     
-    def _identify_trending_issues(self, logs: List[Dict[str, Any]]) -> List[str]:
+    def _identify_trending_issues(self, summary: Dict[str, Any]) -> List[str]:
         """Identify trending compliance issues"""
-        issue_counts = {}
-        
-        for log in logs:
-            if log['compliance_status'] in [ComplianceStatus.VIOLATION.value, ComplianceStatus.WARNING.value]:
-                category = log['rule_category']
-                issue_counts[category] = issue_counts.get(category, 0) + 1
-        
-        # Sort by frequency and return top issues
-        trending = sorted(issue_counts.items(), key=lambda x: x[1], reverse=True)
-        return [f"{category.replace('_', ' ').title()}: {count} issues" for category, count in trending[:3]]
+        # Return the most frequent issue categories
+        trending = summary['issue_categories'].most_common(3)
+        return [f"{category.replace('_', ' ').title()}: {count} issues" for category, count in trending]
     
-    def _get_dashboard_recommendations(self, logs: List[Dict[str, Any]]) -> List[str]:
+    def _get_dashboard_recommendations(self, summary: Dict[str, Any]) -> List[str]:
         """Get dashboard-specific recommendations"""
         recommendations = []
         
-        violation_count = len([log for log in logs if log['compliance_status'] == ComplianceStatus.VIOLATION.value])
+        violation_count = summary['status_totals'][_VIOLATION]
         if violation_count > 0:
             recommendations.append(f"Immediate attention required: {violation_count} compliance violations")
         
-        ai_related = len([log for log in logs if 'ai' in log.get('details', '').lower()])
-        if ai_related > 5:
+        if summary['ai_count'] > 5:
             recommendations.append("Consider AI ethics training and procedure review")
         
         recommendations.append("Regular compliance monitoring recommended")
@@ -774,13 +954,6 @@ Our legal research for your matter includes AI-assisted case law and statute sea
     def health_check(self) -> bool:
         """Check if ethics compliance system is functioning"""
         try:
-            # Test logging functionality
-            test_log = {
-                'log_id': str(uuid.uuid4()),
-                'timestamp': datetime.now().isoformat(),
-                'test': True
-            }
-            
             # Test ethics rules loading
             if not self.ethics_rules:
                 return False
@@ -793,7 +966,6 @@ Our legal research for your matter includes AI-assisted case law and statute sea
             
         except Exception as e:
             logger.error(f"Ethics compliance health check failed: {str(e)}")
-<<<<<<< HEAD
             return False
 
     # Additional methods needed by the main app
@@ -807,6 +979,3 @@ Our legal research for your matter includes AI-assisted case law and statute sea
 
 # Create alias for the class name used in main app
 LegalEthicsMonitoring = LegalEthicsComplianceManager
-=======
-            return False
->>>>>>> 6c3aac01d38711e21958dc83ff6d611bbc727be6
@@ -6,32 +6,84 @@ Handles privilege protection, confidentiality, and secure access controls
 
 import os
 import logging
-import json
 import hashlib
+import heapq
+import hmac
 import secrets
+import time
+import orjson
+from collections import defaultdict, deque
 from datetime import datetime, timedelta
-from typing import Dict, Any, Optional, List
+from functools import lru_cache
+from typing import Dict, Any, Optional, List, Union
 from cryptography.fernet import Fernet
 from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from cryptography.hazmat.primitives.kdf.hkdf import HKDF
 import base64
 import uuid
 
+from .ids import uuid4_batch
+
 logger = logging.getLogger(__name__)
 
+# Audit entries buffered before they are written to the access log, and the age
+# past which the buffer is written. The age is only checked when the next event
+# is logged; there is no timer, so a quiet manager keeps entries until flush()
+AUDIT_LOG_BATCH_SIZE = 500
+AUDIT_LOG_FLUSH_INTERVAL = 30.0
+
+# Most audit entries kept in memory
+AUDIT_LOG_MAX_EVENTS = 200_000
+
+# Prefix marking AES-GCM ciphertext; anything else is a legacy Fernet token
+_AEAD_PREFIX = 'v2:'
+_AEAD_PREFIX_BYTES = _AEAD_PREFIX.encode()
+_AEAD_NONCE_SIZE = 12
+
+# Category bits stored on each audit entry, so reports count without string scans
+_CATEGORY_COMMUNICATION = 1
+_CATEGORY_SESSION = 2
+_CATEGORY_CONFLICT = 4
+_CATEGORY_VIOLATION = 8
+
+# Audit entry ids generated per urandom read
+AUDIT_LOG_ID_BATCH = 256
+
+@lru_cache(maxsize=256)
+def _action_category(action: str) -> int:
+    """Category bits for an access action"""
+    return (
+        ('communication' in action) * _CATEGORY_COMMUNICATION |
+        ('session' in action) * _CATEGORY_SESSION |
+        ('conflict' in action) * _CATEGORY_CONFLICT
+    )
+
 class AttorneyClientPrivilegeManager:
     """
     Manages attorney-client privilege protection with encryption, access controls, and audit logging
     Ensures compliance with legal ethics rules and confidentiality requirements
     """
     
-    def __init__(self):
+    def __init__(self, max_batch: int = AUDIT_LOG_BATCH_SIZE,
+                 flush_interval: float = AUDIT_LOG_FLUSH_INTERVAL,
+                 max_events: int = AUDIT_LOG_MAX_EVENTS):
         """Initialize privilege protection systems"""
         self.master_key = self._initialize_encryption_key()
         self.cipher = Fernet(self.master_key)
+        self._aead = AESGCM(self._derive_aead_key(self.master_key))
         self.session_store = {}
-        self.access_log = []
+        self._session_expiry = []
+        self.access_log = deque(maxlen=max_events)
+        self._logs_by_attorney = defaultdict(deque)
+        self._sessions_by_attorney = defaultdict(set)
+        self._pending = deque()
+        self.max_batch = max_batch
+        self.flush_interval = flush_interval
+        self._last_flush = time.monotonic()
+        self._log_ids = iter(())
         
         # Privilege protection settings
         self.privilege_settings = {
@@ -62,12 +114,24 @@ class AttorneyClientPrivilegeManager:
             logger.error(f"Failed to initialize encryption key: {str(e)}")
             raise
     
+    def _derive_aead_key(self, master_key: bytes) -> bytes:
+        """Derive the AES-GCM key from the master key, separate from the Fernet keys"""
+        return HKDF(
+            algorithm=hashes.SHA256(),
+            length=32,
+            salt=None,
+            info=b'legal-privilege-aes-gcm'
+        ).derive(base64.urlsafe_b64decode(master_key))
+    
     def create_secure_session(self, attorney_id: str, client_id: str = None,
                             session_context: Dict[str, Any] = None) -> Dict[str, Any]:
         """Create secure session for attorney-client communications"""
         try:
             session_id = str(uuid.uuid4())
             session_token = self._generate_session_token()
+            now = datetime.now()
+            now_iso = now.isoformat()
+            expires_at = now + timedelta(minutes=self.privilege_settings['session_timeout_minutes'])
             
             # Create session data
             session_data = {
@@ -75,27 +139,28 @@ class AttorneyClientPrivilegeManager:
                 'session_token': session_token,
                 'attorney_id': attorney_id,
                 'client_id': client_id,
-                'created_at': datetime.now().isoformat(),
-                'expires_at': (datetime.now() + timedelta(minutes=self.privilege_settings['session_timeout_minutes'])).isoformat(),
+                'created_at': now_iso,
+                'expires_at': expires_at.isoformat(),
                 'privilege_level': 'full_privilege' if client_id else 'attorney_only',
                 'access_count': 0,
-                'last_activity': datetime.now().isoformat(),
+                'last_activity': now_iso,
                 'context': session_context or {},
                 'active': True
             }
             
-            # Encrypt session data
-            encrypted_session_data = self.encrypt_privileged_data(json.dumps(session_data))
-            
-            # Store session
+            # Store session in process memory; encrypting it here would not protect
+            # it from anything that can already read the process
             self.session_store[session_id] = {
                 'token': session_token,
-                'encrypted_data': encrypted_session_data,
+                'session_data': session_data,
                 'attorney_id': attorney_id,
                 'client_id': client_id,
-                'created_at': datetime.now(),
-                'last_activity': datetime.now()
+                'created_at': now,
+                'expires_at': expires_at,
+                'last_activity': now
             }
+            self._sessions_by_attorney[attorney_id].add(session_id)
+            heapq.heappush(self._session_expiry, (expires_at, session_id))
             
             # Log session creation
             self._log_privilege_access(
@@ -134,8 +199,8 @@ class AttorneyClientPrivilegeManager:
             
             session_info = self.session_store[session_id]
             
-            # Verify session token
-            if session_info['token'] != session_token:
+            # Verify session token in constant time
+            if not hmac.compare_digest(session_info['token'].encode(), (session_token or '').encode()):
                 self._log_privilege_violation(
                     attorney_id=attorney_id,
                     client_id=client_id,
@@ -144,13 +209,12 @@ class AttorneyClientPrivilegeManager:
                 )
                 return {'authorized': False, 'reason': 'Invalid session token'}
             
-            # Decrypt and verify session data
-            decrypted_data = self.decrypt_privileged_data(session_info['encrypted_data'])
-            session_data = json.loads(decrypted_data)
+            session_data = session_info['session_data']
             
             # Check if session has expired
-            expires_at = datetime.fromisoformat(session_data['expires_at'])
-            if datetime.now() > expires_at:
+            now = datetime.now()
+            expires_at = session_info['expires_at']
+            if now > expires_at:
                 self._invalidate_session(session_id)
                 return {'authorized': False, 'reason': 'Session expired'}
             
@@ -188,9 +252,9 @@ class AttorneyClientPrivilegeManager:
             
             return {
                 'authorized': True,
-                'session_data': session_data,
+                'session_data': dict(session_data),
                 'privilege_level': session_data['privilege_level'],
-                'remaining_time_minutes': int((expires_at - datetime.now()).total_seconds() / 60)
+                'remaining_time_minutes': int((expires_at - now).total_seconds() / 60)
             }
             
         except Exception as e:
@@ -203,20 +267,40 @@ class AttorneyClientPrivilegeManager:
             )
             return {'authorized': False, 'reason': 'Access verification failed'}
     
-    def encrypt_privileged_data(self, data: str) -> str:
+    def encrypt_privileged_bytes(self, data: bytes) -> bytes:
+        """Encrypt privileged data to raw nonce + ciphertext bytes, for binary storage"""
+        nonce = os.urandom(_AEAD_NONCE_SIZE)
+        return nonce + self._aead.encrypt(nonce, data, None)
+    
+    def decrypt_privileged_bytes(self, encrypted_data: bytes) -> bytes:
+        """Decrypt raw bytes produced by encrypt_privileged_bytes"""
+        nonce = encrypted_data[:_AEAD_NONCE_SIZE]
+        return self._aead.decrypt(nonce, encrypted_data[_AEAD_NONCE_SIZE:], None)
+    
+    def encrypt_privileged_data(self, data: Union[str, bytes, Dict, List]) -> str:
         """Encrypt privileged attorney-client data"""
         try:
             if isinstance(data, dict) or isinstance(data, list):
-                data = json.dumps(data)
-            return self.cipher.encrypt(data.encode()).decode()
+                data = orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+            elif isinstance(data, str):
+                data = data.encode()
+            payload = self.encrypt_privileged_bytes(data)
+            return _AEAD_PREFIX + base64.urlsafe_b64encode(payload).decode()
         except Exception as e:
             logger.error(f"Failed to encrypt privileged data: {str(e)}")
             raise
     
-    def decrypt_privileged_data(self, encrypted_data: str) -> str:
+    def decrypt_privileged_data(self, encrypted_data: Union[str, bytes]) -> str:
         """Decrypt privileged attorney-client data"""
         try:
-            return self.cipher.decrypt(encrypted_data.encode()).decode()
+            if isinstance(encrypted_data, str):
+                encrypted_data = encrypted_data.encode()
+            if not encrypted_data.startswith(_AEAD_PREFIX_BYTES):
+                # Data encrypted before the switch to AES-GCM
+                return self.cipher.decrypt(encrypted_data).decode()
+            
+            payload = base64.urlsafe_b64decode(encrypted_data[len(_AEAD_PREFIX_BYTES):])
+            return self.decrypt_privileged_bytes(payload).decode()
         except Exception as e:
             logger.error(f"Failed to decrypt privileged data: {str(e)}")
             raise
@@ -227,6 +311,8 @@ class AttorneyClientPrivilegeManager:
         try:
             # Generate communication ID
             communication_id = str(uuid.uuid4())
+            now = datetime.now()
+            now_iso = now.isoformat()
             
             # Create privilege metadata
             privilege_metadata = {
@@ -238,8 +324,8 @@ class AttorneyClientPrivilegeManager:
                 'confidentiality_level': 'highest',
                 'work_product_protection': communication_data.get('work_product', False),
                 'privilege_holders': [attorney_id, client_id],
-                'created_at': datetime.now().isoformat(),
-                'retention_until': (datetime.now() + timedelta(days=365 * self.privilege_settings['privilege_retention_years'])).isoformat(),
+                'created_at': now_iso,
+                'retention_until': (now + timedelta(days=365 * self.privilege_settings['privilege_retention_years'])).isoformat(),
                 'access_restrictions': {
                     'require_attorney_authorization': True,
                     'require_client_consent': True,
@@ -256,7 +342,7 @@ class AttorneyClientPrivilegeManager:
                 'privilege_metadata': privilege_metadata,
                 'encrypted_content': encrypted_content,
                 'communication_type': communication_data.get('type', 'legal_advice'),
-                'timestamp': datetime.now().isoformat(),
+                'timestamp': now_iso,
                 'integrity_hash': self._calculate_integrity_hash(encrypted_content)
             }
             
@@ -390,19 +476,32 @@ class AttorneyClientPrivilegeManager:
                                 start_date: datetime = None, end_date: datetime = None) -> Dict[str, Any]:
         """Generate comprehensive privilege protection report"""
         try:
+            now = datetime.now()
             if not start_date:
-                start_date = datetime.now() - timedelta(days=30)
+                start_date = now - timedelta(days=30)
             if not end_date:
-                end_date = datetime.now()
-            
-            # Filter access logs
-            relevant_logs = []
-            for log_entry in self.access_log:
-                log_date = datetime.fromisoformat(log_entry['timestamp'])
-                if start_date <= log_date <= end_date:
-                    if attorney_id == log_entry.get('attorney_id'):
-                        if not client_id or client_id == log_entry.get('client_id'):
-                            relevant_logs.append(log_entry)
+                end_date = now
+            
+            self.flush()
+            
+            # Count the attorney's activities newest first, stopping at the start of the period
+            total_events = communications = sessions = conflicts = violations = 0
+            for log_entry in reversed(self._logs_by_attorney.get(attorney_id, ())):
+                log_date = log_entry['_logged_at']
+                if log_date < start_date:
+                    break
+                if log_date <= end_date and (not client_id or client_id == log_entry.get('client_id')):
+                    category = log_entry['_category']
+                    total_events += 1
+                    communications += category & _CATEGORY_COMMUNICATION
+                    sessions += category & _CATEGORY_SESSION
+                    conflicts += category & _CATEGORY_CONFLICT
+                    violations += category & _CATEGORY_VIOLATION
+            
+            # Scale the masked bits back to counts
+            sessions //= _CATEGORY_SESSION
+            conflicts //= _CATEGORY_CONFLICT
+            violations //= _CATEGORY_VIOLATION
             
             # Analyze privilege activities
             privilege_report = {
@@ -414,16 +513,16 @@ class AttorneyClientPrivilegeManager:
                     'end_date': end_date.isoformat()
                 },
                 'privilege_activities': {
-                    'total_access_events': len(relevant_logs),
-                    'privileged_communications': len([log for log in relevant_logs if 'communication' in log['action']]),
-                    'session_activities': len([log for log in relevant_logs if 'session' in log['action']]),
-                    'conflict_checks': len([log for log in relevant_logs if 'conflict' in log['action']]),
-                    'privilege_violations': len([log for log in relevant_logs if log['event_type'] == 'violation'])
+                    'total_access_events': total_events,
+                    'privileged_communications': communications,
+                    'session_activities': sessions,
+                    'conflict_checks': conflicts,
+                    'privilege_violations': violations
                 },
-                'compliance_summary': self._generate_compliance_summary(relevant_logs),
-                'privilege_protection_score': self._calculate_privilege_protection_score(relevant_logs),
-                'recommendations': self._generate_privilege_recommendations(relevant_logs),
-                'generated_at': datetime.now().isoformat()
+                'compliance_summary': self._generate_compliance_summary(total_events, violations),
+                'privilege_protection_score': self._calculate_privilege_protection_score(total_events, violations),
+                'recommendations': self._generate_privilege_recommendations(total_events, violations),
+                'generated_at': now.isoformat()
             }
             
             return privilege_report
@@ -438,20 +537,14 @@ class AttorneyClientPrivilegeManager:
     
     def _update_session_activity(self, session_id: str):
         """Update session last activity timestamp"""
-        if session_id in self.session_store:
-            self.session_store[session_id]['last_activity'] = datetime.now()
+        session_info = self.session_store.get(session_id)
+        if session_info is not None:
+            now = datetime.now()
+            session_info['last_activity'] = now
             
-            # Update encrypted session data
-            encrypted_data = self.session_store[session_id]['encrypted_data']
-            decrypted_data = self.decrypt_privileged_data(encrypted_data)
-            session_data = json.loads(decrypted_data)
-            session_data['last_activity'] = datetime.now().isoformat()
+            session_data = session_info['session_data']
+            session_data['last_activity'] = now.isoformat()
             session_data['access_count'] = session_data.get('access_count', 0) + 1
-            
-            # Re-encrypt updated data
-            self.session_store[session_id]['encrypted_data'] = self.encrypt_privileged_data(
-                json.dumps(session_data)
-            )
     
     def _invalidate_session(self, session_id: str):
         """Invalidate an expired or compromised session"""
@@ -469,18 +562,30 @@ class AttorneyClientPrivilegeManager:
             
             # Remove from session store
             del self.session_store[session_id]
+            attorney_sessions = self._sessions_by_attorney.get(session_info.get('attorney_id'))
+            if attorney_sessions is not None:
+                attorney_sessions.discard(session_id)
+                if not attorney_sessions:
+                    del self._sessions_by_attorney[session_info.get('attorney_id')]
     
-    def _calculate_integrity_hash(self, data: str) -> str:
+    def _calculate_integrity_hash(self, data: Union[str, bytes]) -> str:
         """Calculate integrity hash for data verification"""
-        return hashlib.sha256(data.encode()).hexdigest()
+        # BLAKE2b is faster than SHA-256 in software; the ciphertext is already
+        # authenticated, so this only fingerprints the stored content
+        if isinstance(data, str):
+            data = data.encode()
+        return hashlib.blake2b(data, digest_size=32).hexdigest()
     
     def _log_privilege_access(self, attorney_id: str, client_id: str = None,
                             action: str = '', session_id: str = None,
                             details: str = '', **kwargs):
         """Log privilege-related access event"""
+        logged_at = datetime.now()
         log_entry = {
-            'log_id': str(uuid.uuid4()),
-            'timestamp': datetime.now().isoformat(),
+            'log_id': self._next_log_id(),
+            'timestamp': logged_at.isoformat(),
+            '_logged_at': logged_at,
+            '_category': _action_category(action or ''),
             'event_type': 'access',
             'attorney_id': attorney_id,
             'client_id': client_id,
@@ -492,15 +597,17 @@ class AttorneyClientPrivilegeManager:
             'privilege_level': kwargs.get('privilege_level', 'standard')
         }
         
-        self.access_log.append(log_entry)
-        logger.info(f"Privilege access logged: {action} by attorney {attorney_id}")
+        self._buffer_audit_entry(log_entry)
     
     def _log_privilege_violation(self, attorney_id: str, client_id: str = None,
                                violation_type: str = '', details: str = '', **kwargs):
         """Log privilege violation event"""
+        logged_at = datetime.now()
         violation_entry = {
-            'log_id': str(uuid.uuid4()),
-            'timestamp': datetime.now().isoformat(),
+            'log_id': self._next_log_id(),
+            'timestamp': logged_at.isoformat(),
+            '_logged_at': logged_at,
+            '_category': _CATEGORY_VIOLATION,
             'event_type': 'violation',
             'violation_type': violation_type,
             'attorney_id': attorney_id,
@@ -511,9 +618,53 @@ class AttorneyClientPrivilegeManager:
             'severity': kwargs.get('severity', 'high')
         }
         
-        self.access_log.append(violation_entry)
+        self._buffer_audit_entry(violation_entry)
         logger.warning(f"Privilege violation logged: {violation_type} by attorney {attorney_id}")
     
+    def _next_log_id(self) -> str:
+        """Return a random UUID string for an audit entry from the pre-generated batch"""
+        log_id = next(self._log_ids, None)
+        if log_id is None:
+            self._log_ids = iter(uuid4_batch(AUDIT_LOG_ID_BATCH))
+            log_id = next(self._log_ids)
+        return log_id
+    
+    def _buffer_audit_entry(self, entry: Dict[str, Any]):
+        """Queue an audit entry, flushing when the batch is full or has waited too long"""
+        self._pending.append(entry)
+        if (len(self._pending) >= self.max_batch or
+                time.monotonic() - self._last_flush >= self.flush_interval):
+            self.flush()
+    
+    def flush(self) -> int:
+        """Write buffered audit entries to the access log"""
+        self._last_flush = time.monotonic()
+        pending = self._pending
+        flushed = len(pending)
+        if not flushed:
+            return 0
+        
+        access_log = self.access_log
+        logs_by_attorney = self._logs_by_attorney
+        for entry in pending:
+            # Entries leaving the bounded access log leave the attorney index with
+            # them; log order is global, so each is its attorney's oldest entry
+            if len(access_log) == access_log.maxlen:
+                evicted_attorney = access_log[0]['attorney_id']
+                history = logs_by_attorney[evicted_attorney]
+                history.popleft()
+                if not history:
+                    del logs_by_attorney[evicted_attorney]
+            access_log.append(entry)
+            logs_by_attorney[entry['attorney_id']].append(entry)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Privilege access logged: %s", "; ".join(
+                f"{entry.get('action') or entry.get('violation_type')} by attorney {entry['attorney_id']}"
+                for entry in pending
+            ))
+        pending.clear()
+        return flushed
+    
     def _get_attorney_relationships(self, attorney_id: str) -> List[Dict[str, Any]]:
         """Get existing attorney-client relationships for conflict checking"""
         # This would integrate with the legal database in production
@@ -556,11 +707,8 @@ class AttorneyClientPrivilegeManager:
         # For now, return empty list
         return business_conflicts
     
-    def _generate_compliance_summary(self, logs: List[Dict[str, Any]]) -> Dict[str, Any]:
-        """Generate compliance summary from access logs"""
-        total_events = len(logs)
-        violations = len([log for log in logs if log['event_type'] == 'violation'])
-        
+    def _generate_compliance_summary(self, total_events: int, violations: int) -> Dict[str, Any]:
+        """Generate compliance summary from access log counts"""
         compliance_score = ((total_events - violations) / max(total_events, 1)) * 100
         
         return {
@@ -572,27 +720,22 @@ class AttorneyClientPrivilegeManager:
                               'needs_improvement'
         }
     
-    def _calculate_privilege_protection_score(self, logs: List[Dict[str, Any]]) -> int:
+    def _calculate_privilege_protection_score(self, total_events: int, violations: int) -> int:
         """Calculate privilege protection effectiveness score"""
-        if not logs:
+        if not total_events:
             return 100
         
-        violations = len([log for log in logs if log['event_type'] == 'violation'])
-        total_events = len(logs)
-        
         protection_score = max(0, min(100, int(((total_events - violations) / total_events) * 100)))
         return protection_score
     
-    def _generate_privilege_recommendations(self, logs: List[Dict[str, Any]]) -> List[str]:
+    def _generate_privilege_recommendations(self, total_events: int, violations: int) -> List[str]:
         """Generate recommendations for privilege protection improvement"""
         recommendations = []
         
-        violations = [log for log in logs if log['event_type'] == 'violation']
-        
         if violations:
-            recommendations.append(f"Review and address {len(violations)} privilege violations")
+            recommendations.append(f"Review and address {violations} privilege violations")
         
-        if len(logs) > 100:
+        if total_events > 100:
             recommendations.append("Consider implementing additional access monitoring")
         
         recommendations.extend([
@@ -608,19 +751,13 @@ class AttorneyClientPrivilegeManager:
         current_time = datetime.now()
         expired_sessions = []
         
-        for session_id, session_info in self.session_store.items():
-            try:
-                encrypted_data = session_info['encrypted_data']
-                decrypted_data = self.decrypt_privileged_data(encrypted_data)
-                session_data = json.loads(decrypted_data)
-                
-                expires_at = datetime.fromisoformat(session_data['expires_at'])
-                if current_time > expires_at:
-                    expired_sessions.append(session_id)
-                    
-            except Exception as e:
-                logger.error(f"Error checking session expiration: {str(e)}")
-                expired_sessions.append(session_id)  # Remove problematic sessions
+        # Pop only the sessions whose expiry has passed; entries for sessions
+        # already invalidated elsewhere are discarded as they come up
+        expiry_heap = self._session_expiry
+        while expiry_heap and expiry_heap[0][0] < current_time:
+            _, session_id = heapq.heappop(expiry_heap)
+            if session_id in self.session_store:
+                expired_sessions.append(session_id)
         
         # Remove expired sessions
         for session_id in expired_sessions:
@@ -632,26 +769,32 @@ class AttorneyClientPrivilegeManager:
     def get_privilege_status(self, attorney_id: str, client_id: str) -> Dict[str, Any]:
         """Get current privilege protection status"""
         try:
-            # Count recent activities
-            recent_logs = [
-                log for log in self.access_log 
-                if (log.get('attorney_id') == attorney_id and 
-                    log.get('client_id') == client_id and
-                    datetime.fromisoformat(log['timestamp']) > datetime.now() - timedelta(days=7))
-            ]
+            self.flush()
+            
+            # Count recent activities, walking the attorney's log newest first
+            cutoff = datetime.now() - timedelta(days=7)
+            recent_activities = 0
+            last_activity = None
+            for log in reversed(self._logs_by_attorney.get(attorney_id, ())):
+                if log['_logged_at'] <= cutoff:
+                    break
+                if log.get('client_id') == client_id:
+                    recent_activities += 1
+                    if last_activity is None:
+                        last_activity = log['timestamp']
             
             status = {
                 'attorney_id': attorney_id,
                 'client_id': client_id,
                 'privilege_status': 'active',
-                'recent_activities': len(recent_logs),
-                'last_activity': max([log['timestamp'] for log in recent_logs]) if recent_logs else None,
+                'recent_activities': recent_activities,
+                'last_activity': last_activity,
                 'protection_level': 'full_privilege',
                 'compliance_status': 'compliant',
-                'active_sessions': len([
-                    session for session in self.session_store.values()
-                    if session['attorney_id'] == attorney_id and session.get('client_id') == client_id
-                ])
+                'active_sessions': sum(
+                    1 for session_id in self._sessions_by_attorney.get(attorney_id, ())
+                    if self.session_store[session_id].get('client_id') == client_id
+                )
             }
             
             return status
@@ -674,11 +817,13 @@ class AttorneyClientPrivilegeManager:
             # Clean up expired sessions
             self.cleanup_expired_sessions()
             
+            # Write out any buffered audit entries
+            self.flush()
+            
             return True
             
         except Exception as e:
             logger.error(f"Privilege protection health check failed: {str(e)}")
-<<<<<<< HEAD
             return False
 
     # Additional methods needed by the main app
@@ -704,23 +849,15 @@ class AttorneyClientPrivilegeManager:
     def verify_privileged_session(self, attorney_id: str, client_id: str, session_token: str) -> bool:
         """Verify privileged session is valid"""
         # Find session by attorney and client
-        for session_id, session_info in self.session_store.items():
-            if (session_info.get('attorney_id') == attorney_id and 
-                session_info.get('client_id') == client_id and
-                session_info.get('token') == session_token):
+        for session_id in self._sessions_by_attorney.get(attorney_id, ()):
+            session_info = self.session_store[session_id]
+            if (session_info.get('client_id') == client_id and
+                hmac.compare_digest(session_info['token'].encode(), (session_token or '').encode())):
                 
                 # Verify session hasn't expired
-                try:
-                    encrypted_data = session_info['encrypted_data']
-                    decrypted_data = self.decrypt_privileged_data(encrypted_data)
-                    session_data = json.loads(decrypted_data)
-                    
-                    expires_at = datetime.fromisoformat(session_data['expires_at'])
-                    if datetime.now() <= expires_at:
-                        self._update_session_activity(session_id)
-                        return True
-                except Exception as e:
-                    logger.error(f"Error verifying session: {str(e)}")
+                if datetime.now() <= session_info['expires_at']:
+                    self._update_session_activity(session_id)
+                    return True
                     
         return False
 
@@ -750,6 +887,7 @@ class AttorneyClientPrivilegeManager:
     def decrypt_privileged_history(self, encrypted_history: List[Dict]) -> List[Dict]:
         """Decrypt privileged history data"""
         decrypted_history = []
+        access_timestamp = datetime.now().isoformat()
         for item in encrypted_history:
             try:
                 # Create a copy to avoid modifying original
@@ -757,7 +895,7 @@ class AttorneyClientPrivilegeManager:
                 
                 # Add privilege protection indicator
                 decrypted_item['privilege_protected'] = True
-                decrypted_item['access_timestamp'] = datetime.now().isoformat()
+                decrypted_item['access_timestamp'] = access_timestamp
                 
                 decrypted_history.append(decrypted_item)
                 
@@ -766,6 +904,3 @@ class AttorneyClientPrivilegeManager:
                 continue
                 
         return decrypted_history
-=======
-            return False
->>>>>>> 6c3aac01d38711e21958dc83ff6d611bbc727be6
@@ -33,15 +33,15 @@ class LegalAIDemo:
         
         # Initialize system components
         try:
-            from database.chromadb_legal_manager import LegalKnowledgeStore
-            from database.sqlite_legal_manager import LegalDataManager
+            from database.chromadb_legal_manager import get_legal_knowledge_store
+            from database.sqlite_legal_manager import get_legal_data_manager
             from agents.research_agent import LegalResearchAgent
             from agents.case_agent import CaseAnalysisAgent
             from agents.document_agent import DocumentReviewAgent
             from agents.precedent_agent import PrecedentMiningAgent
             
-            self.knowledge_store = LegalKnowledgeStore()
-            self.legal_db = LegalDataManager()
+            self.knowledge_store = get_legal_knowledge_store()
+            self.legal_db = get_legal_data_manager()
             
             # Initialize agents
             self.research_agent = LegalResearchAgent(self.knowledge_store, self.legal_db)
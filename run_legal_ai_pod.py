@@ -6,6 +6,7 @@ Comprehensive startup script for the Legal AI Case Intelligence System
 
 import os
 import sys
+import http.client
 import subprocess
 import signal
 import time
@@ -22,6 +23,10 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Backend readiness polling: seconds to wait in total and between attempts
+BACKEND_START_TIMEOUT = 15
+BACKEND_POLL_INTERVAL = 0.1
+
 class LegalAIPodLauncher:
     """Manages startup and coordination of Legal AI Pod services"""
     
@@ -176,10 +181,8 @@ class LegalAIPodLauncher:
                 sys.executable, str(app_file)
             ], cwd=self.backend_dir)
             
-            # Give the server time to start
-            time.sleep(3)
-            
-            if self.backend_process.poll() is None:
+            # Continue as soon as the server answers instead of sleeping a fixed time
+            if self.wait_for_backend():
                 logger.info("Backend server started successfully on http://localhost:5000")
                 return True
             else:
@@ -190,6 +193,25 @@ class LegalAIPodLauncher:
             logger.error(f"Failed to start backend: {e}")
             return False
     
+    def wait_for_backend(self, timeout: float = BACKEND_START_TIMEOUT) -> bool:
+        """Poll the backend over one reusable HTTP connection until it responds or exits"""
+        conn = http.client.HTTPConnection("localhost", 5000, timeout=1)
+        deadline = time.monotonic() + timeout
+        
+        try:
+            while time.monotonic() < deadline and self.backend_process.poll() is None:
+                try:
+                    conn.request("GET", "/")
+                    conn.getresponse().read()
+                    return True
+                except (OSError, http.client.HTTPException):
+                    # Not listening yet; the next request reconnects
+                    conn.close()
+                    time.sleep(BACKEND_POLL_INTERVAL)
+            return False
+        finally:
+            conn.close()
+    
     def start_frontend(self):
         """Start the React frontend development server"""
         if not self.frontend_dir.exists():
@@ -156,18 +156,18 @@ LOG_FILE=logs/legal_app.log
         
         try:
             # Import database managers
-            from database.sqlite_legal_manager import LegalDataManager
-            from database.chromadb_legal_manager import LegalKnowledgeStore
+            from database.sqlite_legal_manager import get_legal_data_manager
+            from database.chromadb_legal_manager import get_legal_knowledge_store
             
             # Initialize SQLite database
             logger.info("Setting up SQLite legal database...")
-            legal_db = LegalDataManager()
+            legal_db = get_legal_data_manager()
             legal_db.initialize_database()
             logger.info("✓ SQLite database initialized")
             
             # Initialize ChromaDB
             logger.info("Setting up ChromaDB legal knowledge store...")
-            knowledge_store = LegalKnowledgeStore()
+            knowledge_store = get_legal_knowledge_store()
             knowledge_store.initialize_collections()
             logger.info("✓ ChromaDB initialized")
             
@@ -180,9 +180,9 @@ LOG_FILE=logs/legal_app.log
         logger.info("Loading legal knowledge...")
         
         try:
-            from database.chromadb_legal_manager import LegalKnowledgeStore
+            from database.chromadb_legal_manager import get_legal_knowledge_store
             
-            knowledge_store = LegalKnowledgeStore()
+            knowledge_store = get_legal_knowledge_store()
             
             # Load legal knowledge data
             legal_knowledge_file = self.data_path / "legal_knowledge.json"
@@ -192,30 +192,26 @@ LOG_FILE=logs/legal_app.log
             # Load case law
             if 'case_law' in legal_data:
                 logger.info("Loading case law...")
-                for case in legal_data['case_law']:
-                    knowledge_store.add_case_law(case)
-                logger.info(f"✓ Loaded {len(legal_data['case_law'])} cases")
+                added = knowledge_store.add_case_law_batch(legal_data['case_law'])
+                logger.info(f"✓ Loaded {added} of {len(legal_data['case_law'])} cases")
             
             # Load statutes
             if 'statutes' in legal_data:
                 logger.info("Loading statutes...")
-                for statute in legal_data['statutes']:
-                    knowledge_store.add_statute(statute)
-                logger.info(f"✓ Loaded {len(legal_data['statutes'])} statutes")
+                added = knowledge_store.add_statute_batch(legal_data['statutes'])
+                logger.info(f"✓ Loaded {added} of {len(legal_data['statutes'])} statutes")
             
             # Load precedents
             if 'legal_precedents' in legal_data:
                 logger.info("Loading legal precedents...")
-                for precedent in legal_data['legal_precedents']:
-                    knowledge_store.add_precedent(precedent)
-                logger.info(f"✓ Loaded {len(legal_data['legal_precedents'])} precedents")
+                added = knowledge_store.add_precedent_batch(legal_data['legal_precedents'])
+                logger.info(f"✓ Loaded {added} of {len(legal_data['legal_precedents'])} precedents")
             
             # Load contract templates
             if 'contract_templates' in legal_data:
                 logger.info("Loading contract templates...")
-                for template in legal_data['contract_templates']:
-                    knowledge_store.add_contract_template(template)
-                logger.info(f"✓ Loaded {len(legal_data['contract_templates'])} contract templates")
+                added = knowledge_store.add_contract_template_batch(legal_data['contract_templates'])
+                logger.info(f"✓ Loaded {added} of {len(legal_data['contract_templates'])} contract templates")
             
         except Exception as e:
             logger.error(f"Failed to load legal knowledge: {e}")
@@ -226,9 +222,9 @@ LOG_FILE=logs/legal_app.log
         logger.info("Loading legal entities...")
         
         try:
-            from database.sqlite_legal_manager import LegalDataManager
+            from database.sqlite_legal_manager import get_legal_data_manager
             
-            legal_db = LegalDataManager()
+            legal_db = get_legal_data_manager()
             
             # Load legal entities data
             entities_file = self.data_path / "legal_entities.json"
@@ -284,11 +280,11 @@ LOG_FILE=logs/legal_app.log
         
         try:
             # Test database connections
-            from database.sqlite_legal_manager import LegalDataManager
-            from database.chromadb_legal_manager import LegalKnowledgeStore
+            from database.sqlite_legal_manager import get_legal_data_manager
+            from database.chromadb_legal_manager import get_legal_knowledge_store
             
-            legal_db = LegalDataManager()
-            knowledge_store = LegalKnowledgeStore()
+            legal_db = get_legal_data_manager()
+            knowledge_store = get_legal_knowledge_store()
             
             # Test basic operations
             test_query = "contract law"